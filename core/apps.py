@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self) -> None:
+        """Import signals when app is ready."""
+        # Import signals here to avoid circular import issues
+        import core.signals  # noqa: PLC0415,F401
@@ -1,9 +1,39 @@
-from typing import Any
+import hashlib
+from typing import Any, ClassVar
 
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication as BaseTokenAuthentication
 
+from .cache import CacheManager
 from .models import MultiDeviceToken
+from .permissions import get_user_role
+
+# Tokens change rarely, so validated tokens may be kept briefly in the cache to
+# skip the database round-trip on the next request from the same device. Off
+# by default: revocations must reach every worker, so tokens are only cached
+# when a shared cache backend is configured (see token_cache_enabled).
+TOKEN_CACHE_TTL = getattr(settings, "DMR_AUTH_TOKEN_CACHE_TTL", 0)
+
+
+def token_cache_key(key: str) -> str:
+    """Build the cache key for a token without storing the raw token value."""
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return f"core:auth_token:{digest}"
+
+
+def token_cache_enabled() -> bool:
+    """
+    Check whether validated tokens may be cached.
+
+    A process-local cache would keep serving a token revoked, or a user
+    deactivated, through another worker until the entry expired.
+
+    Returns:
+        bool: True if a TTL is set and the default cache is shared
+    """
+    return bool(TOKEN_CACHE_TTL) and CacheManager.is_shared_backend()
 
 
 class MultiDeviceTokenAuthentication(BaseTokenAuthentication):
@@ -14,13 +44,40 @@ class MultiDeviceTokenAuthentication(BaseTokenAuthentication):
 
     model = MultiDeviceToken
 
+    # Columns needed to authorize and describe the user on each request; the
+    # password hash and login timestamps are never read on the token path.
+    user_fields: ClassVar[tuple[str, ...]] = (
+        "user__id",
+        "user__username",
+        "user__email",
+        "user__first_name",
+        "user__last_name",
+        "user__is_active",
+        "user__is_staff",
+        "user__is_superuser",
+    )
+
     def authenticate_credentials(self, key: str) -> tuple[Any, Any]:
-        try:
-            token = self.model.objects.select_related("user").get(key=key)
-        except self.model.DoesNotExist:
-            msg = "Invalid token."
-            # Raise from None to avoid masking unexpected errors (B904)
-            raise exceptions.AuthenticationFailed(msg) from None
+        use_cache = token_cache_enabled()
+        cache_key = token_cache_key(key)
+        token = cache.get(cache_key) if use_cache else None
+        if token is None:
+            try:
+                token = (
+                    self.model.objects
+                    .select_related("user")
+                    .only("key", "user", *self.user_fields)
+                    .get(key=key)
+                )
+            except self.model.DoesNotExist:
+                msg = "Invalid token."
+                # Raise from None to avoid masking unexpected errors (B904)
+                raise exceptions.AuthenticationFailed(msg) from None
+            if use_cache:
+                # Resolve the role before caching; it is memoized on the user,
+                # so later requests on this token authorize without a group query
+                get_user_role(token.user)
+                cache.set(cache_key, token, TOKEN_CACHE_TTL)
 
         if not token.user.is_active:
             msg = "User inactive or deleted."
@@ -13,23 +13,85 @@ Cache Key Strategy:
 - Includes: application, model name, action, and sorted parameters
 """
 
+import functools
 import hashlib
-import json
-from dataclasses import dataclass
+import itertools
+import logging
+import math
+import re
+import secrets
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
 from typing import ClassVar
 
 from django.conf import settings
-from django.core.cache import cache
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
 from django.db.models import Model
+from django.http import HttpResponse, HttpResponseNotModified, QueryDict
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
-from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
-VERSION_PARTS_COUNT = 3
+# Separators in a key prefix that pin down its `app:model:` namespace
+NAMESPACE_SEPARATORS = 2
 
+# Keys examined per Redis SCAN step; larger steps need fewer round trips
+REDIS_SCAN_COUNT = getattr(settings, "DMR_REDIS_SCAN_COUNT", 10_000)
 
-@dataclass
+# Keys removed per pipelined UNLINK command
+REDIS_UNLINK_BATCH = 500
+
+# Longest string value embedded verbatim in a cache key instead of hashed
+READABLE_PARAM_MAX_LENGTH = 32
+
+# Parameter names that may be embedded verbatim; anything else is hashed
+READABLE_PARAM_NAME = re.compile(rf"[A-Za-z0-9_]{{1,{READABLE_PARAM_MAX_LENGTH}}}")
+
+logger = logging.getLogger(__name__)
+
+# Fields of a cached list entry: (etag, content, compressed)
+LIST_ENTRY_FIELDS = 3
+
+# Distinguishes a cached None from an absent key
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _key_prefix(app: str, model: str, action: str) -> str:
+    """Return the interned `app:model:action` prefix shared by cache keys."""
+    return sys.intern(f"{app}:{model}:{action}")
+
+
+@functools.lru_cache(maxsize=2048)
+def _hash_param_items(items: tuple[tuple[str, str], ...], algorithm: str) -> str:
+    """
+    Hash canonical `(repr(key), repr(value))` pairs, memoized across requests.
+
+    Polling clients repeat the same few parameter sets, so most calls are
+    answered from the LRU without touching the hasher.
+    """
+    if algorithm == "sha256":
+        hasher = hashlib.sha256()
+    else:
+        hasher = hashlib.blake2b(digest_size=8)
+    # Delimit pairs with the ASCII unit/record separators; repr() escapes
+    # control characters in keys and values, so neither can forge a separator
+    for key, value in items:
+        hasher.update(f"{key}\x1f{value}\x1e".encode())
+    return hasher.hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
 class CacheParamConfig:
     """
     Configuration for building cache parameters.
@@ -40,7 +102,7 @@ class CacheParamConfig:
         user_sensitive: Whether to include user_id in cache keys
     """
 
-    cache_key_params: list[str] | None = None
+    cache_key_params: Sequence[str] | None = None
     kwargs: dict | None = None
     user_sensitive: bool = False
 
@@ -51,16 +113,23 @@ class CacheKeyGenerator:
     # Maximum TTL for cache (default 5 minutes for frequently polled data)
     DEFAULT_TTL = getattr(settings, "DMR_CACHE_TTL", 300)
 
-    @staticmethod
-    def _serialize_params(params: dict[str, object]) -> str:
-        """Serialize parameters to a consistent string format."""
-        sorted_params = sorted(params.items())
-        return json.dumps(sorted_params, default=str, sort_keys=True)
+    # Hash used for cache key params: "blake2b" (default) or "sha256" for
+    # deployments that must keep keys stable across a migration
+    HASH_ALGORITHM = getattr(settings, "DMR_CACHE_HASH", "blake2b")
 
     @staticmethod
-    def _hash_params(params_str: str) -> str:
-        """Hash parameters string for URL-safe key format."""
-        return hashlib.sha256(params_str.encode()).hexdigest()[:16]
+    def _hash_params(params: dict[str, object]) -> str:
+        """
+        Hash parameters into a short, URL-safe digest.
+
+        Sorted `repr(key)=repr(value)` pairs are streamed straight into the hasher,
+        so no intermediate serialized string is built, and digests of
+        recently seen parameter sets are memoized. Cache keys have no
+        cryptographic requirement, so a 64-bit BLAKE2b digest (16 hex
+        characters) is used unless DMR_CACHE_HASH selects SHA-256.
+        """
+        items = tuple(sorted((repr(key), repr(value)) for key, value in params.items()))
+        return _hash_param_items(items, CacheKeyGenerator.HASH_ALGORITHM)
 
     @staticmethod
     def generate_key(
@@ -79,7 +148,8 @@ class CacheKeyGenerator:
             **params: Query parameters to include in cache key
 
         Returns:
-            Cache key string in format: app:model:action:hash(params)
+            Cache key string in format: app:model:action:hash(params), or
+            app:model:action:key_value for a single short scalar param
 
         Examples:
             >>> CacheKeyGenerator.generate_key(
@@ -88,14 +158,57 @@ class CacheKeyGenerator:
             ... )
             'patients:file:list:a1b2c3d4e5f6...'
         """
+        return CacheKeyGenerator.generate_key_with_prefix(
+            _key_prefix(app, model, action), params
+        )
+
+    @staticmethod
+    def generate_key_with_prefix(prefix: str, params: dict[str, object]) -> str:
+        """
+        Generate a cache key from a precomputed `app:model:action` prefix.
+
+        Callers that build many keys for one prefix, such as CacheMixin,
+        skip re-assembling it on every request.
+
+        Args:
+            prefix: Key prefix in `app:model:action` form
+            params: Query parameters to include in cache key
+
+        Returns:
+            Cache key string, as produced by generate_key
+        """
         if not params:
-            base_key = f"{app}:{model}:{action}"
-        else:
-            params_str = CacheKeyGenerator._serialize_params(params)
-            params_hash = CacheKeyGenerator._hash_params(params_str)
-            base_key = f"{app}:{model}:{action}:{params_hash}"
+            return prefix
+        if len(params) == 1 and (readable := CacheKeyGenerator._readable_param(params)):
+            # A single short scalar is embedded as-is, skipping the hash
+            return f"{prefix}:{readable}"
+        return f"{prefix}:{CacheKeyGenerator._hash_params(params)}"
 
-        return base_key
+    @staticmethod
+    def _readable_param(params: dict[str, object]) -> str | None:
+        """
+        Format a single scalar parameter as `key_value` for direct use in a key.
+
+        Only short `[A-Za-z0-9_]` names with integer or short ASCII
+        alphanumeric values qualify, so the result stays key-safe for every
+        cache backend even when the name comes from the query string. Hex
+        digests never contain `_`, so readable keys cannot collide with
+        hashed ones.
+
+        Returns:
+            str | None: The readable segment, or None to fall back to hashing
+        """
+        ((key, value),) = params.items()
+        if isinstance(value, bool) or not READABLE_PARAM_NAME.fullmatch(key):
+            return None
+        if isinstance(value, int) or (
+            isinstance(value, str)
+            and len(value) <= READABLE_PARAM_MAX_LENGTH
+            and value.isascii()
+            and value.isalnum()
+        ):
+            return f"{key}_{value}"
+        return None
 
     @classmethod
     def generate_invalidation_keys(
@@ -125,29 +238,106 @@ class CacheKeyGenerator:
             ... )
             ['patients:file:list:*', 'patients:file:list:patient_1:*', ...]
         """
-        keys_to_invalidate = []
+        list_prefix = _key_prefix(app, model, "list")
 
-        # Always invalidate list caches for the model
-        keys_to_invalidate.append(f"{app}:{model}:list:*")
-
-        # Invalidate specific filter caches
-        if params:
-            # Generate partial keys for common filtering scenarios
-            for param_key, param_value in params.items():
-                keys_to_invalidate.append(
-                    f"{app}:{model}:list:{param_key}_{param_value}:*"
-                )
-
-        return keys_to_invalidate
+        # Always invalidate list caches for the model, including the
+        # unparameterized key used for the plain first page, followed by
+        # partial keys for the affected filtering scenarios
+        return [
+            list_prefix,
+            f"{list_prefix}:*",
+            *[
+                f"{list_prefix}:{param_key}_{param_value}:*"
+                for param_key, param_value in params.items()
+            ],
+        ]
 
 
 class CacheManager:
     """Manage cache operations for model queries and writes."""
 
+    # Secondary index of keys written through set_cached, grouped by their
+    # `app:model` namespace. Backends without delete_pattern (e.g. LocMemCache)
+    # use it to visit only the keys of the affected namespace on invalidation
+    # instead of scanning every entry in the cache. Each namespace is capped
+    # at KEY_INDEX_MAX_KEYS: a full namespace first drops keys the backend
+    # has expired or culled, and is invalidated outright if still full.
+    KEY_INDEX_MAX_KEYS = getattr(settings, "DMR_CACHE_KEY_INDEX_MAX_KEYS", 1000)
+    _key_index: ClassVar[dict[str, set[str]]] = {}
+    _key_index_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Striped locks that serialize recomputation of a cold key within a
+    # process, so concurrent misses on the same key run the query only once.
+    # Waiters stop after RECOMPUTE_LOCK_TIMEOUT seconds and query themselves,
+    # so a slow rebuild or a shared stripe cannot stall other requests.
+    RECOMPUTE_LOCK_STRIPES = 64
+    RECOMPUTE_LOCK_TIMEOUT = 5.0
+    _recompute_locks: ClassVar[tuple[threading.Lock, ...]] = tuple(
+        threading.Lock() for _ in range(RECOMPUTE_LOCK_STRIPES)
+    )
+
+    # Per-namespace [hits, writes] counters feeding adaptive TTLs. Counts are
+    # per process and approximate; they only steer the TTL, never correctness.
+    ADAPTIVE_TTL_MIN = 60
+    ADAPTIVE_TTL_MAX = 3600
+    _namespace_stats: ClassVar[dict[str, list[int]]] = {}
+
+    # Invalidation strategy per cache backend class, chosen on first use so
+    # writes skip re-probing the backend. Keyed by class, so test suites that
+    # swap backends get a fresh choice.
+    _invalidators: ClassVar[dict[type, Callable[[list[str]], None]]] = {}
+
+    # Optional in-process layer in front of a shared backend such as Redis,
+    # holding recent reads for L1_TTL seconds (DMR_CACHE_L1_TTL). Writes and
+    # invalidations in this process clear it, but those made by other workers
+    # only show up once entries expire, so it is disabled by default.
+    L1_TTL = getattr(settings, "DMR_CACHE_L1_TTL", 0)
+    L1_MAX_ENTRIES = 1024
+    _l1: ClassVar[OrderedDict[str, tuple[float, object]]] = OrderedDict()
+    _l1_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @staticmethod
     def get_cached(key: str, default: object = None) -> object:
         """Get value from cache."""
-        return cache.get(key, default)
+        if not CacheManager.L1_TTL:
+            return cache.get(key, default)
+
+        now = time.monotonic()
+        with CacheManager._l1_lock:
+            entry = CacheManager._l1.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        with CacheManager._l1_lock:
+            CacheManager._l1[key] = (now + CacheManager.L1_TTL, value)
+            CacheManager._l1.move_to_end(key)
+            if len(CacheManager._l1) > CacheManager.L1_MAX_ENTRIES:
+                CacheManager._l1.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _discard_l1(prefixes: list[str]) -> None:
+        """Drop in-process entries whose keys start with any of the prefixes."""
+        with CacheManager._l1_lock:
+            if not CacheManager._l1:
+                return
+            prefix_tuple = tuple(prefixes)
+            for key in [k for k in CacheManager._l1 if k.startswith(prefix_tuple)]:
+                del CacheManager._l1[key]
+
+    @staticmethod
+    def recompute_lock(key: str) -> threading.Lock:
+        """
+        Return the lock guarding recomputation of a cache key.
+
+        Callers re-check the cache after acquiring it, so only the first of
+        several concurrent misses rebuilds the value.
+        """
+        locks = CacheManager._recompute_locks
+        return locks[hash(key) % len(locks)]
 
     @staticmethod
     def set_cached(
@@ -166,61 +356,230 @@ class CacheManager:
         if timeout is None:
             timeout = CacheKeyGenerator.DEFAULT_TTL
         cache.set(key, value, timeout)
+        if CacheManager.L1_TTL:
+            CacheManager._discard_l1([key])
+        if CacheManager._get_invalidator() is CacheManager._invalidate_locmem_cache:
+            CacheManager._index_key(key)
 
     @staticmethod
-    def _extract_actual_cache_key(cache_key: str) -> str:
-        """Extract actual cache key from internal Django cache format."""
-        if cache_key.startswith(":"):
-            parts = cache_key.split(":", 2)
-            return parts[2] if len(parts) == VERSION_PARTS_COUNT else cache_key
-        return cache_key
+    def is_shared_backend() -> bool:
+        """
+        Check whether the default cache is shared between worker processes.
+
+        LocMemCache lives inside one process, so entries it holds cannot be
+        invalidated by writes handled in another worker.
+
+        Returns:
+            bool: True if every worker reads and writes the same cache
+        """
+        backend_class = type(caches[DEFAULT_CACHE_ALIAS])
+        return not issubclass(backend_class, (LocMemCache, DummyCache))
+
+    @staticmethod
+    def _get_invalidator() -> Callable[[list[str]], None]:
+        """Return the invalidation function for the active cache backend."""
+        backend_class = type(caches[DEFAULT_CACHE_ALIAS])
+        invalidator = CacheManager._invalidators.get(backend_class)
+        if invalidator is None:
+            if hasattr(backend_class, "delete_pattern"):
+                invalidator = CacheManager._invalidate_redis_cache
+            elif issubclass(backend_class, RedisCache):
+                invalidator = CacheManager._invalidate_native_redis_cache
+            else:
+                invalidator = CacheManager._invalidate_locmem_cache
+            CacheManager._invalidators[backend_class] = invalidator
+        return invalidator
+
+    @staticmethod
+    def record_hit(namespace: str) -> None:
+        """Count a cache hit for a namespace."""
+        CacheManager._namespace_stats.setdefault(namespace, [0, 0])[0] += 1
+
+    @staticmethod
+    def record_write(namespace: str) -> None:
+        """Count a write (invalidation) for a namespace."""
+        CacheManager._namespace_stats.setdefault(namespace, [0, 0])[1] += 1
+
+    @staticmethod
+    def adaptive_ttl(namespace: str, base: int | None = None) -> int:
+        """
+        Compute a TTL scaled by how often a namespace is read per write.
+
+        Read-heavy namespaces keep entries longer, while churn-heavy ones
+        fall back to the base TTL: `base * (1 + ln(hits_per_write))`,
+        clamped to [ADAPTIVE_TTL_MIN, ADAPTIVE_TTL_MAX]. Unless pattern
+        invalidation reaches every worker (Redis), only keys indexed by this
+        process are cleared on a write, so the TTL is also capped at
+        DEFAULT_TTL; a write handled by one worker must not leave the others
+        serving stale entries for longer.
+
+        Args:
+            namespace: Cache namespace in `app:model` form
+            base: Base TTL in seconds (None uses default TTL from settings)
+
+        Returns:
+            int: TTL in seconds
+        """
+        if base is None:
+            base = CacheKeyGenerator.DEFAULT_TTL
+        hits, writes = CacheManager._namespace_stats.get(namespace, (0, 0))
+        hits_per_write = max(hits / max(writes, 1), 1)
+        ttl = base * (1 + math.log(hits_per_write))
+        ceiling = (
+            CacheManager.ADAPTIVE_TTL_MAX
+            if CacheManager._get_invalidator()
+            is not CacheManager._invalidate_locmem_cache
+            else CacheKeyGenerator.DEFAULT_TTL
+        )
+        return int(min(max(ttl, CacheManager.ADAPTIVE_TTL_MIN), ceiling))
+
+    @staticmethod
+    def _key_namespace(key: str) -> str:
+        """Return the `app:model` namespace of a cache key."""
+        # Slice up to the second separator rather than splitting and joining
+        end = key.find(":", key.find(":") + 1)
+        return key if end < 0 else key[:end]
+
+    @staticmethod
+    def _index_key(key: str) -> None:
+        """
+        Record a cache key in the secondary index.
+
+        Expired and culled entries are never reported by the backend, so a
+        namespace that reaches KEY_INDEX_MAX_KEYS is pruned to the keys still
+        cached. If that leaves it full, every key in it is deleted, which
+        keeps the index bounded however many distinct keys clients request.
+        """
+        namespace = CacheManager._key_namespace(key)
+        with CacheManager._key_index_lock:
+            keys = CacheManager._key_index.setdefault(namespace, set())
+            if key not in keys and len(keys) >= CacheManager.KEY_INDEX_MAX_KEYS:
+                keys.intersection_update(cache.get_many(list(keys)))
+                if len(keys) >= CacheManager.KEY_INDEX_MAX_KEYS:
+                    cache.delete_many(list(keys))
+                    keys.clear()
+            keys.add(key)
+
+    @staticmethod
+    def _pop_indexed_keys(pattern_prefix: str) -> list[str]:
+        """
+        Remove and return indexed keys matching a pattern prefix.
+
+        A prefix that spells out its full `app:model:` namespace is resolved
+        with a single index lookup; shorter prefixes visit only the
+        namespaces that overlap them. Either way the cost is proportional to
+        the keys of the affected models rather than the size of the cache.
+        """
+        matched: list[str] = []
+        index = CacheManager._key_index
+        with CacheManager._key_index_lock:
+            if pattern_prefix.count(":") >= NAMESPACE_SEPARATORS:
+                namespaces = [CacheManager._key_namespace(pattern_prefix)]
+            else:
+                namespaces = [ns for ns in index if ns.startswith(pattern_prefix)]
+            for namespace in namespaces:
+                keys = index.get(namespace)
+                if not keys:
+                    continue
+                hits = [key for key in keys if key.startswith(pattern_prefix)]
+                keys.difference_update(hits)
+                if not keys:
+                    del index[namespace]
+                matched.extend(hits)
+        return matched
 
     @staticmethod
     def _extract_pattern_prefix(pattern: str) -> str:
         """Extract the pattern prefix for matching cache keys."""
         pattern_stripped = pattern.rstrip("*")
-        if ":write:" in pattern_stripped:
-            parts = pattern_stripped.split(":write:")
-            return parts[0]
+        write_index = pattern_stripped.find(":write:")
+        if write_index >= 0:
+            # Keep the trailing separator so `app:model` does not also match
+            # the keys of a sibling model such as `app:model_other`.
+            return pattern_stripped[: write_index + 1]
         return pattern_stripped
 
     @staticmethod
-    def _invalidate_redis_cache(patterns: list[str]) -> bool:
-        """Attempt to invalidate cache using Redis delete_pattern."""
-        try:
+    def _invalidate_redis_cache(patterns: list[str]) -> None:
+        """
+        Invalidate cache using Redis pattern deletion.
+
+        With django-redis, keys matching every pattern are collected with
+        SCAN and removed through one pipeline, instead of a separate
+        delete_pattern round trip per pattern. UNLINK is used so Redis frees
+        the values in a background thread rather than blocking on DEL.
+        Other backends exposing delete_pattern fall back to calling it per
+        pattern.
+        """
+        client_wrapper = getattr(cache, "client", None)
+        if not (
+            hasattr(client_wrapper, "make_pattern")
+            and hasattr(client_wrapper, "get_client")
+        ):
             for pattern in patterns:
                 cache.delete_pattern(pattern)
-        except AttributeError:
-            return False
-        else:
-            return True
+            return
+
+        CacheManager._unlink_matching(
+            client_wrapper.get_client(write=True),
+            [client_wrapper.make_pattern(pattern) for pattern in patterns],
+        )
+
+    @staticmethod
+    def _invalidate_native_redis_cache(patterns: list[str]) -> None:
+        """
+        Invalidate cache using Django's built-in RedisCache backend.
+
+        That backend has no delete_pattern, and a per-process key index would
+        miss keys written by other workers, so Redis is scanned directly.
+        """
+        CacheManager._unlink_matching(
+            cache._cache.get_client(write=True),  # noqa: SLF001
+            [cache.make_key(pattern) for pattern in patterns],
+        )
+
+    @staticmethod
+    def _unlink_matching(client: object, match_patterns: list[str]) -> None:
+        """
+        Unlink every Redis key matching the given glob patterns.
+
+        Keys are collected with SCAN and removed through one pipeline, in
+        batches of REDIS_UNLINK_BATCH.
+
+        Args:
+            client: A redis-py client for the primary server
+            match_patterns: Fully qualified glob patterns to match
+        """
+        keys = [
+            key
+            for match in match_patterns
+            for key in client.scan_iter(match=match, count=REDIS_SCAN_COUNT)
+        ]
+        if not keys:
+            return
+        pipeline = client.pipeline(transaction=False)
+        for batch in itertools.batched(keys, REDIS_UNLINK_BATCH):
+            pipeline.unlink(*batch)
+        pipeline.execute()
 
     @staticmethod
     def _invalidate_locmem_cache(patterns: list[str]) -> None:
-        """Invalidate cache for LocMemCache backend."""
-        try:
-            if not hasattr(cache, "_cache"):
-                return
-            cache_dict = cache._cache  # noqa: SLF001
-            for pattern in patterns:
-                pattern_prefix = CacheManager._extract_pattern_prefix(pattern)
-                keys_to_delete = []
-                for k in cache_dict:
-                    actual_key = CacheManager._extract_actual_cache_key(k)
-                    if pattern_prefix in actual_key:
-                        keys_to_delete.append(actual_key)
-                for key in keys_to_delete:
-                    cache.delete(key)
-        except (AttributeError, TypeError):
-            pass
+        """Invalidate indexed keys for backends without delete_pattern."""
+        keys_to_delete: list[str] = []
+        for pattern in patterns:
+            pattern_prefix = CacheManager._extract_pattern_prefix(pattern)
+            keys_to_delete.extend(CacheManager._pop_indexed_keys(pattern_prefix))
+        if keys_to_delete:
+            cache.delete_many(keys_to_delete)
 
     @staticmethod
     def invalidate_cache(patterns: str | list[str]) -> None:
         """
         Invalidate cache keys matching a pattern or list of patterns.
 
-        For locmem cache, clears all matching keys manually.
-        For Redis cache, uses delete_pattern if available.
+        For locmem cache, clears matching keys recorded by set_cached.
+        For Redis cache, uses delete_pattern if available, or scans Redis
+        directly with Django's built-in RedisCache.
 
         Pattern matching logic:
         - `app:model:write:param:*` clears all `app:model:*` cache keys
@@ -232,9 +591,11 @@ class CacheManager:
         # Convert single string to list
         pattern_list = [patterns] if isinstance(patterns, str) else patterns
 
-        # Try Redis first, then fallback to LocMemCache
-        if not CacheManager._invalidate_redis_cache(pattern_list):
-            CacheManager._invalidate_locmem_cache(pattern_list)
+        CacheManager._get_invalidator()(pattern_list)
+        if CacheManager.L1_TTL:
+            CacheManager._discard_l1([
+                CacheManager._extract_pattern_prefix(p) for p in pattern_list
+            ])
 
 
 class CacheParamBuilder:
@@ -248,7 +609,7 @@ class CacheParamBuilder:
 
     # Parameters that should never be included in cache keys
     # (they don't affect data content, only presentation)
-    NEVER_CACHE_PARAMS: ClassVar[set[str]] = {"format", "callback"}
+    NEVER_CACHE_PARAMS: ClassVar[frozenset[str]] = frozenset({"format", "callback"})
 
     @staticmethod
     def build_from_request(
@@ -262,6 +623,9 @@ class CacheParamBuilder:
         1. Explicit: Only include specified cache_key_params (+ page + user_id)
         2. Implicit: Include ALL query params (+ kwargs + page + user_id)
 
+        The page number is omitted for the first page, which is equivalent
+        to requesting no page at all.
+
         Args:
             request: The request object containing query parameters
             config: Configuration for parameter extraction
@@ -272,35 +636,36 @@ class CacheParamBuilder:
         config = config or CacheParamConfig()
         params: dict[str, object] = {}
         kwargs = config.kwargs or {}
+        # Resolve the DRF query_params property once instead of per param
+        query_params = request.query_params
+        never_cache_params = CacheParamBuilder.NEVER_CACHE_PARAMS
+        page = None
 
         # Mode 1: Explicit cache key params specified
         if config.cache_key_params:
-            for param in config.cache_key_params:
-                value = request.query_params.get(param)
-                if value is None and param in kwargs:
-                    value = kwargs[param]
-                if value is not None:
-                    params[param] = value
+            params = CacheParamBuilder._explicit_params(
+                query_params, config.cache_key_params, kwargs
+            )
+            page = query_params.get("page")
         # Mode 2: Include all query params (except never-cache params)
         else:
-            # Add all query params except those that never affect cache
-            params = {
-                param: value
-                for param, value in request.query_params.items()
-                if param not in CacheParamBuilder.NEVER_CACHE_PARAMS and param != "page"
-            }
+            # Add all query params except those that never affect cache,
+            # picking up the page number in the same pass
+            for param, value in query_params.items():
+                if param == "page":
+                    page = value
+                elif param not in never_cache_params:
+                    params[param] = value
 
             # Add URL kwargs (e.g., patient_pk from /patients/{patient_pk}/files/)
             for key, value in kwargs.items():
-                if (
-                    key not in params
-                    and key not in CacheParamBuilder.NEVER_CACHE_PARAMS
-                ):
+                if key not in params and key not in never_cache_params:
                     params[key] = value
 
-        # Always include page parameter for pagination
-        page = request.query_params.get("page", "1")
-        params["page"] = page
+        # Include the page number only past the first page, so the common
+        # unfiltered first-page request maps to the short unhashed key
+        if page is not None and page != "1":
+            params["page"] = page
 
         # Add user ID for user-sensitive caching
         if config.user_sensitive:
@@ -308,10 +673,38 @@ class CacheParamBuilder:
 
         return params
 
+    @staticmethod
+    def _explicit_params(
+        query_params: QueryDict,
+        param_names: Sequence[str],
+        kwargs: dict,
+    ) -> dict[str, object]:
+        """
+        Collect the named parameters, preferring query params over kwargs.
+
+        Args:
+            query_params: The request's query parameters
+            param_names: Names of the parameters that key the cache
+            kwargs: URL kwargs used when a query param is absent
+
+        Returns:
+            Dictionary of the parameters that have a value
+        """
+        params: dict[str, object] = {}
+        # Bind the lookup once rather than resolving it for every param
+        query_get = query_params.get
+        for param in param_names:
+            value = query_get(param)
+            if value is None and param in kwargs:
+                value = kwargs[param]
+            if value is not None:
+                params[param] = value
+        return params
+
     @staticmethod
     def extract_invalidation_params(
         instance: Model,
-        param_names: list[str],
+        param_names: Sequence[str],
     ) -> dict[str, object]:
         """
         Extract invalidation parameters from a model instance.
@@ -354,6 +747,14 @@ class CacheMixin:
         * True: Different users get different cache entries (for permission-based filtering)
         * False: All users share the same cache (for public data)
     - cache_ttl: Cache timeout in seconds (None uses default TTL from settings)
+        * 0 disables list caching, skipping key construction entirely
+    - cache_adaptive_ttl: Whether to scale cache_ttl by the model's hit/write ratio
+        * True: Read-heavy models keep entries longer (see CacheManager.adaptive_ttl)
+        * False: Always use cache_ttl
+    - cache_max_bytes: Largest rendered list page stored in the cache
+        * Bigger pages are served uncached (DMR_CACHE_MAX_BYTES, default 512 KiB)
+    - cache_compress_min_bytes: Smallest rendered page stored zlib-compressed
+        * DMR_CACHE_COMPRESS_MIN_BYTES, default 4 KiB; None stores pages as-is
     """
 
     cache_app: str = "app"
@@ -362,72 +763,270 @@ class CacheMixin:
     cache_invalidate_params: ClassVar[list[str]] = []
     cache_user_sensitive: ClassVar[bool] = False
     cache_ttl: int | None = None
+    cache_adaptive_ttl: ClassVar[bool] = False
+    cache_max_bytes: ClassVar[int] = getattr(
+        settings, "DMR_CACHE_MAX_BYTES", 512 * 1024
+    )
+    cache_compress_min_bytes: ClassVar[int | None] = getattr(
+        settings, "DMR_CACHE_COMPRESS_MIN_BYTES", 4096
+    )
+
+    # Per-subclass snapshots of the configuration, resolved at class creation
+    _cache_key_param_names: ClassVar[tuple[str, ...]] = ()
+    _cache_base_config: ClassVar[CacheParamConfig] = CacheParamConfig()
+    _cache_invalidate_param_names: ClassVar[tuple[str, ...]] = ()
+    _cache_write_active: ClassVar[bool] = False
+    _cache_namespace: ClassVar[str] = "app:model"
+    # Invalidation patterns in the format of generate_invalidation_keys:
+    # fixed list patterns plus one `(param, prefix)` template per param
+    _cache_list_prefix: ClassVar[str] = "app:model:list"
+    _cache_list_patterns: ClassVar[tuple[str, ...]] = ()
+    _cache_param_pattern_templates: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._cache_namespace = f"{cls.cache_app}:{cls.cache_model}"
+        cls._cache_key_param_names = tuple(cls.cache_key_params)
+        cls._cache_invalidate_param_names = tuple(cls.cache_invalidate_params)
+        cls._cache_write_active = bool(cls._cache_invalidate_param_names)
+        cls._cache_base_config = CacheParamConfig(
+            cache_key_params=cls._cache_key_param_names,
+            user_sensitive=cls.cache_user_sensitive,
+        )
+        list_prefix = _key_prefix(cls.cache_app, cls.cache_model, "list")
+        cls._cache_list_prefix = list_prefix
+        cls._cache_list_patterns = (list_prefix, f"{list_prefix}:*")
+        cls._cache_param_pattern_templates = tuple(
+            (param, f"{list_prefix}:{param}_")
+            for param in cls._cache_invalidate_param_names
+        )
 
     def _get_cache_config(self, **kwargs: object) -> CacheParamConfig:
-        return CacheParamConfig(
-            cache_key_params=self.cache_key_params,
-            kwargs=kwargs,
-            user_sensitive=self.cache_user_sensitive,
-        )
+        # Share the class-level config unless URL kwargs must be overlaid
+        if not kwargs:
+            return self._cache_base_config
+        return replace(self._cache_base_config, kwargs=kwargs)
+
+    def _get_invalidation_keys(self, instance: Model | None) -> list[str]:
+        """
+        Build the cache key patterns affected by a write to an instance.
+
+        Produces the same patterns as CacheKeyGenerator.generate_invalidation_keys,
+        but from templates prepared at class creation, so a write only
+        substitutes the instance values.
+
+        Args:
+            instance: Model instance to extract invalidation params from
+
+        Returns:
+            List of cache key patterns to invalidate (empty when none apply)
+        """
+        if instance is None or not self._cache_write_active:
+            return []
+
+        param_patterns = [
+            f"{prefix}{value}:*"
+            for param, prefix in self._cache_param_pattern_templates
+            if (value := getattr(instance, param, None)) is not None
+        ]
+        if not param_patterns:
+            return []
+
+        return [*self._cache_list_patterns, *param_patterns]
 
     def _invalidate_cache_for_instance(self, instance: Model | None) -> None:
         """
-        Extract parameters from instance and invalidate related caches.
+        Queue the caches related to an instance for invalidation.
 
-        Uses CacheParamBuilder.extract_invalidation_params for consistent
-        parameter extraction logic.
+        Patterns are collected for the whole request and cleared in a single
+        batch by finalize_response, so repeated writes share one pass.
 
         Args:
             instance: Model instance to extract invalidation params from
         """
-        if not instance or not self.cache_invalidate_params:
-            return
+        keys_to_invalidate = self._get_invalidation_keys(instance)
+        if keys_to_invalidate:
+            # A dict keeps the patterns ordered while dropping duplicates
+            pending = self.__dict__.setdefault("_cache_pending_invalidation", {})
+            pending.update(dict.fromkeys(keys_to_invalidate))
+
+    def _flush_cache_invalidation(self) -> None:
+        """Invalidate every pattern queued during the current request."""
+        pending = self.__dict__.pop("_cache_pending_invalidation", None)
+        if pending:
+            CacheManager.invalidate_cache(list(pending))
+            if self.cache_adaptive_ttl:
+                CacheManager.record_write(self._cache_namespace)
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: object,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        """Apply the cache invalidations queued while handling the request."""
+        self._flush_cache_invalidation()
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def get_cache_ttl(self) -> int | None:
+        """
+        Return the TTL for a new list cache entry.
 
-        # Use centralized parameter extraction
-        invalidation_data = CacheParamBuilder.extract_invalidation_params(
-            instance,
-            self.cache_invalidate_params,
-        )
+        Override for custom strategies; None uses the default TTL.
+        """
+        if self.cache_adaptive_ttl:
+            return CacheManager.adaptive_ttl(self._cache_namespace, self.cache_ttl)
+        return self.cache_ttl
+
+    def _get_list_cache_key(self, request: Request, **kwargs: object) -> str:
+        """
+        Build the list cache key for a request, memoized on the request.
 
-        if invalidation_data:
-            keys_to_invalidate = CacheKeyGenerator.generate_invalidation_keys(
-                self.cache_app,
-                self.cache_model,
-                **invalidation_data,
+        The key is deterministic for a given request, so it is stored on the
+        request object and reused by any later lookup in the same cycle.
+
+        Args:
+            request: The request object containing query parameters
+            **kwargs: URL kwargs passed to the list action
+
+        Returns:
+            Cache key string for the list response
+        """
+        cache_key = getattr(request, "_dmr_cache_key", None)
+        if cache_key is None:
+            # Build cache config using centralized configuration
+            config = self._get_cache_config(**kwargs)
+            params = CacheParamBuilder.build_from_request(request, config)
+            cache_key = CacheKeyGenerator.generate_key_with_prefix(
+                self._cache_list_prefix, params
             )
-            for key_pattern in keys_to_invalidate:
-                CacheManager.invalidate_cache(key_pattern)
+            request._dmr_cache_key = cache_key  # noqa: SLF001
+        return cache_key
+
+    @staticmethod
+    def _has_results(data: object) -> bool:
+        """
+        Check whether list response data contains any results.
+
+        Empty pages are cheap to recompute, so they are not worth pickling
+        into the cache where they would compete with hot entries for space.
+
+        Args:
+            data: Response data, either a paginated dict or a plain list
+
+        Returns:
+            bool: False for an empty page or list, True otherwise
+        """
+        if isinstance(data, dict) and "results" in data:
+            return bool(data["results"])
+        if isinstance(data, list):
+            return bool(data)
+        return True
 
     def list(self, request: Request, *args: object, **kwargs: object) -> object:
         """
         Override list to add caching.
 
-        Caches successful GET requests and returns cached data if available.
+        Caches successful GET requests as rendered JSON bytes and returns
+        them directly on a hit, skipping DRF rendering. Requests negotiated
+        to another renderer (e.g. the browsable API) bypass the cache.
+        Cached responses carry an ETag; a matching If-None-Match header gets
+        a 304 Not Modified without a body.
         Uses centralized CacheParamBuilder for consistent parameter handling.
         """
-        if request.method != "GET":
+        if (
+            request.method != "GET"
+            or self.cache_ttl == 0
+            or not isinstance(getattr(request, "accepted_renderer", None), JSONRenderer)
+        ):
             return super().list(request, *args, **kwargs)
 
-        # Build cache config using centralized configuration
-        config = self._get_cache_config(**kwargs)
-        params = CacheParamBuilder.build_from_request(request, config)
-
-        cache_key = CacheKeyGenerator.generate_key(
-            self.cache_app,
-            self.cache_model,
-            "list",
-            **params,
-        )
+        cache_key = self._get_list_cache_key(request, **kwargs)
         # Try cache first
-        cached_data = CacheManager.get_cached(cache_key)
-        if cached_data is not None:
-            return Response(cached_data, status=status.HTTP_200_OK)
+        cached_entry = self._list_entry(CacheManager.get_cached(cache_key))
+        if cached_entry is None:
+            # Serialize cold-key rebuilds so a burst of misses queries once
+            lock = CacheManager.recompute_lock(cache_key)
+            acquired = lock.acquire(timeout=CacheManager.RECOMPUTE_LOCK_TIMEOUT)
+            try:
+                cached_entry = self._list_entry(CacheManager.get_cached(cache_key))
+                if cached_entry is None:
+                    return self._list_and_cache(request, cache_key, *args, **kwargs)
+            finally:
+                if acquired:
+                    lock.release()
+
+        if self.cache_adaptive_ttl:
+            CacheManager.record_hit(self._cache_namespace)
+        etag, content, compressed = cached_entry
+        # Clients already holding this entry get an empty 304 instead
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            if compressed:
+                content = zlib.decompress(content)
+            response = HttpResponse(content, content_type=JSONRenderer.media_type)
+        response["ETag"] = etag
+        return response
 
+    @staticmethod
+    def _list_entry(cached: object) -> tuple[str, bytes, bool] | None:
+        """
+        Return a cached list entry if it has the current shape.
+
+        Entries written by older releases (e.g. `(etag, content)` pairs) are
+        treated as misses and overwritten, rather than failing to unpack.
+
+        Returns:
+            tuple | None: `(etag, content, compressed)`, or None for a miss
+        """
+        if isinstance(cached, tuple) and len(cached) == LIST_ENTRY_FIELDS:
+            return cached
+        return None
+
+    def _list_and_cache(
+        self,
+        request: Request,
+        cache_key: str,
+        *args: object,
+        **kwargs: object,
+    ) -> object:
+        """Run the uncached list action and store a successful result."""
         response = super().list(request, *args, **kwargs)
 
-        # Cache successful response
-        if response.status_code == status.HTTP_200_OK:
-            CacheManager.set_cached(cache_key, response.data, self.cache_ttl)
+        # Cache successful, non-empty responses
+        if response.status_code == status.HTTP_200_OK and self._has_results(
+            response.data
+        ):
+            content = JSONRenderer().render(response.data)
+            # Send the same bytes now, so the miss is rendered only once
+            response.content = content
+            response["Content-Type"] = JSONRenderer.media_type
+
+            # Oversized pages would evict many small entries for one hit
+            if len(content) > self.cache_max_bytes:
+                logger.debug(
+                    "Not caching %s: %d bytes exceeds %d",
+                    cache_key,
+                    len(content),
+                    self.cache_max_bytes,
+                )
+                return response
+
+            # Each cache fill gets a fresh tag, so any invalidation changes it
+            etag = quote_etag(secrets.token_hex(8))
+            # Larger JSON pages shrink several times over at the fastest level
+            compressed = (
+                self.cache_compress_min_bytes is not None
+                and len(content) >= self.cache_compress_min_bytes
+            )
+            if compressed:
+                content = zlib.compress(content, 1)
+            CacheManager.set_cached(
+                cache_key, (etag, content, compressed), self.get_cache_ttl()
+            )
+            response["ETag"] = etag
 
         return response
 
@@ -1,5 +1,4 @@
-import binascii
-import os
+import secrets
 
 from django.conf import settings
 from django.db import models
@@ -35,4 +34,4 @@ class MultiDeviceToken(models.Model):
 
     @classmethod
     def generate_key(cls) -> str:
-        return binascii.hexlify(os.urandom(20)).decode()
+        return secrets.token_hex(20)
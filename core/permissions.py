@@ -8,6 +8,17 @@ This module defines permissions based on user roles:
 
 from typing import ClassVar
 
+from django.contrib.auth.models import User
+from django.db.models import (
+    Case,
+    CharField,
+    Exists,
+    OuterRef,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 from rest_framework.request import Request
 
@@ -15,6 +26,27 @@ from student_groups.models import ApprovedFile
 
 from .context import Role
 
+# Attribute used to memoize the resolved role on a user instance
+USER_ROLE_ATTR = "_dmr_role"
+
+# Role names read once, so hot-path checks skip the enum attribute lookups
+_ADMIN = Role.ADMIN.value
+_INSTRUCTOR = Role.INSTRUCTOR.value
+_STUDENT = Role.STUDENT.value
+
+# Group-backed roles, from highest to lowest privilege
+ROLE_HIERARCHY = (_ADMIN, _INSTRUCTOR, _STUDENT)
+
+# Roles with unrestricted object access
+_STAFF_ROLES = frozenset({_ADMIN, _INSTRUCTOR})
+
+# Method sets for role_permissions; frozensets give hashed membership checks
+ALL_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+READ_ONLY_METHODS = frozenset(SAFE_METHODS)
+
+# One bit per HTTP method, so a role's allowed methods compile to an int mask
+METHOD_BITS = {method: 1 << bit for bit, method in enumerate(sorted(ALL_METHODS))}
+
 
 def get_user_role(user: object | None) -> str | None:
     """
@@ -23,6 +55,9 @@ def get_user_role(user: object | None) -> str | None:
     Returns the highest privilege role if user belongs to multiple groups.
     Hierarchy: admin > instructor > student
 
+    The result is memoized on the user instance, so repeated lookups for the
+    same request user (permissions, views, serializers) share one resolution.
+
     Args:
         user: Django User instance
 
@@ -32,19 +67,79 @@ def get_user_role(user: object | None) -> str | None:
     if not user or not user.is_authenticated:
         return None
 
-    # Check for admin role (superuser or admin group)
-    if user.is_superuser or user.groups.filter(name=Role.ADMIN.value).exists():
-        return Role.ADMIN.value
+    user_state = user.__dict__
+    if USER_ROLE_ATTR not in user_state:
+        user_state[USER_ROLE_ATTR] = _resolve_user_role(user)
+    return user_state[USER_ROLE_ATTR]
 
-    # Check for instructor role
-    if user.groups.filter(name=Role.INSTRUCTOR.value).exists():
-        return Role.INSTRUCTOR.value
 
-    # Check for student role
-    if user.groups.filter(name=Role.STUDENT.value).exists():
-        return Role.STUDENT.value
+def annotate_user_role(queryset: QuerySet) -> QuerySet:
+    """
+    Annotate a User queryset with each user's role, computed in SQL.
 
-    return None
+    The role is stored under USER_ROLE_ATTR, so get_user_role (and the
+    serializers using it) reads it without a query per user.
+
+    Args:
+        queryset: User queryset to annotate
+
+    Returns:
+        QuerySet: The queryset with the role annotation
+    """
+    memberships = User.groups.through.objects.filter(user=OuterRef("pk"))
+    return queryset.annotate(
+        **{
+            USER_ROLE_ATTR: Case(
+                When(is_superuser=True, then=Value(_ADMIN)),
+                *[
+                    When(
+                        Exists(memberships.filter(group__name=role)),
+                        then=Value(role),
+                    )
+                    for role in ROLE_HIERARCHY
+                ],
+                default=None,
+                output_field=CharField(),
+            ),
+        },
+    )
+
+
+def approved_file_filter(user: object) -> Q:
+    """
+    Build the filter matching ApprovedFile rows that grant a user file access.
+
+    Files are approved in a completed investigation request owned by the user,
+    or manually released to the user.
+
+    Args:
+        user: Django User instance
+
+    Returns:
+        Q: Filter for ApprovedFile querysets
+    """
+    return (
+        Q(imaging_request__user=user, imaging_request__status="completed")
+        | Q(blood_test_request__user=user, blood_test_request__status="completed")
+        | Q(released_to_user=user)
+    )
+
+
+def _resolve_user_role(user: object) -> str | None:
+    """Resolve a user's role from the database in a single query."""
+    # Superusers are admins without needing the admin group
+    if user.is_superuser:
+        return _ADMIN
+
+    # Reuse groups loaded with prefetch_related("groups") instead of querying
+    prefetched = getattr(user, "_prefetched_objects_cache", {}).get("groups")
+    if prefetched is not None:
+        group_names = {group.name for group in prefetched}
+    else:
+        group_names = set(
+            user.groups.filter(name__in=ROLE_HIERARCHY).values_list("name", flat=True)
+        )
+    return next((role for role in ROLE_HIERARCHY if role in group_names), None)
 
 
 class BaseRolePermission(BasePermission):
@@ -53,12 +148,22 @@ class BaseRolePermission(BasePermission):
     Subclasses should override role_permissions dict and optionally has_object_permission.
     """
 
-    # Override in subclasses: {role: [allowed_methods]}
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {}
+    # Override in subclasses: {role: frozenset(allowed_methods)}
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {}
+
+    # Whether admins bypass role_permissions, resolved at class creation
+    _admin_bypass: ClassVar[bool] = True
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._role_cache: dict[str, str | None] = {}
+    # role_permissions compiled to {role: METHOD_BITS mask} at class creation
+    _role_masks: ClassVar[dict[str, int]] = {}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._admin_bypass = _ADMIN not in cls.role_permissions
+        cls._role_masks = {
+            role: sum(METHOD_BITS[method] for method in methods)
+            for role, methods in cls.role_permissions.items()
+        }
 
     def has_permission(self, request: Request, _view: object) -> bool:
         """Check if user has permission to access the endpoint"""
@@ -67,14 +172,12 @@ class BaseRolePermission(BasePermission):
             return False
 
         # Admin always has full access unless explicitly restricted
-        if (
-            user_role == Role.ADMIN.value
-            and Role.ADMIN.value not in self.role_permissions
-        ):
+        if user_role == _ADMIN and self._admin_bypass:
             return True
 
-        allowed_methods = self.role_permissions.get(user_role, [])
-        return request.method in allowed_methods
+        return bool(
+            self._role_masks.get(user_role, 0) & METHOD_BITS.get(request.method, 0)
+        )
 
     def has_object_permission(
         self, request: Request, _view: object, _obj: object
@@ -84,19 +187,15 @@ class BaseRolePermission(BasePermission):
 
     def _get_user_role(self, user: object | None) -> str | None:
         """
-        Get user role with caching per username.
+        Get user role, shared across every permission check in the request.
+
+        get_user_role memoizes the role on the request's user instance, so
+        has_permission, has_object_permission and serializers resolve it once.
 
         Returns:
             str | None: User role or None if not authenticated or no role
         """
-        if not user or not user.is_authenticated:
-            return None
-
-        username = user.username
-        if username not in self._role_cache:
-            self._role_cache[username] = get_user_role(user)
-
-        return self._role_cache[username]
+        return get_user_role(user)
 
     def _check_ownership(self, request: Request, obj: object) -> bool:
         """
@@ -109,26 +208,19 @@ class BaseRolePermission(BasePermission):
         """
         user_role = self._get_user_role(request.user)
 
-        if user_role in (Role.ADMIN.value, Role.INSTRUCTOR.value):
+        if user_role in _STAFF_ROLES:
             return True
 
-        if user_role == Role.STUDENT.value:
-            return hasattr(obj, "user") and obj.user == request.user
+        if user_role == _STUDENT:
+            # Compare the stored foreign key so the owner is never fetched
+            return getattr(obj, "user_id", None) == request.user.pk
 
         return False
 
 
 class StudentGroupPermission(BaseRolePermission):
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
 
@@ -140,17 +232,9 @@ class PatientPermission(BaseRolePermission):
     - Admin: full access (inherited)
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: SAFE_METHODS,
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: READ_ONLY_METHODS,
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
 
@@ -162,17 +246,9 @@ class ObservationPermission(BaseRolePermission):
     - Admin: full access (inherited)
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
-        Role.INSTRUCTOR.value: SAFE_METHODS,  # Read-only access
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: ALL_METHODS,
+        Role.INSTRUCTOR.value: READ_ONLY_METHODS,  # Read-only access
     }
 
     def has_object_permission(
@@ -188,17 +264,9 @@ class FileAccessPermission(BaseRolePermission):
     - Students: can access files approved via lab requests or manual releases
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: SAFE_METHODS,
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: READ_ONLY_METHODS,
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
     def has_object_permission(
@@ -207,33 +275,16 @@ class FileAccessPermission(BaseRolePermission):
         """Check file access permissions"""
         user_role = self._get_user_role(request.user)
 
-        if user_role in (Role.ADMIN.value, Role.INSTRUCTOR.value):
+        if user_role in _STAFF_ROLES:
             return True
 
         # Students must have an approved investigation request or manual release
-        if user_role == Role.STUDENT.value:
-            # Check if file is approved in any completed investigation request
-            imaging_request_exists = ApprovedFile.objects.filter(
-                file=obj,
-                imaging_request__user=request.user,
-                imaging_request__status="completed",
+        if user_role == _STUDENT:
+            # Approved in a completed investigation request, or manually
+            # released to the student, checked in a single query
+            return ApprovedFile.objects.filter(
+                approved_file_filter(request.user), file=obj
             ).exists()
-            blood_test_request_exists = ApprovedFile.objects.filter(
-                file=obj,
-                blood_test_request__user=request.user,
-                blood_test_request__status="completed",
-            ).exists()
-            # Check if file has been manually released to the student
-            manual_release_exists = ApprovedFile.objects.filter(
-                file=obj,
-                released_to_user=request.user,
-            ).exists()
-
-            return (
-                imaging_request_exists
-                or blood_test_request_exists
-                or manual_release_exists
-            )
 
         return False
 
@@ -250,17 +301,9 @@ class InvestigationRequestPermission(BaseRolePermission):
     - Admins: inherit full access (handled by BaseRolePermission).
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: [*SAFE_METHODS, "POST", "DELETE"],
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: READ_ONLY_METHODS | {"POST", "DELETE"},
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
     def has_object_permission(
@@ -277,17 +320,9 @@ class GoogleFormLinkPermission(BaseRolePermission):
     - Admin: full access (inherited)
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: SAFE_METHODS,
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: READ_ONLY_METHODS,
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
 
@@ -300,25 +335,9 @@ class MedicationOrderPermission(BaseRolePermission):
     - Admins: inherit full access (handled by BaseRolePermission)
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: ALL_METHODS,
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
     def has_object_permission(
@@ -336,25 +355,9 @@ class DischargeSummaryPermission(BaseRolePermission):
     - Admins: inherit full access (handled by BaseRolePermission)
     """
 
-    role_permissions: ClassVar[dict[str, list[str] | tuple[str, ...]]] = {
-        Role.STUDENT.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
-        Role.INSTRUCTOR.value: [
-            "GET",
-            "POST",
-            "PUT",
-            "PATCH",
-            "DELETE",
-            "HEAD",
-            "OPTIONS",
-        ],
+    role_permissions: ClassVar[dict[str, frozenset[str]]] = {
+        Role.STUDENT.value: ALL_METHODS,
+        Role.INSTRUCTOR.value: ALL_METHODS,
     }
 
     def has_object_permission(
@@ -1,12 +1,37 @@
+import copy
+import functools
 from typing import Any, ClassVar
 
+from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
 from rest_framework import serializers
 
 from .permissions import get_user_role
 
+# Longest password accepted for login, matching Django's historic cap; longer
+# inputs are rejected before authenticate() spends a hash on them
+MAX_PASSWORD_LENGTH = getattr(settings, "DMR_MAX_PASSWORD_LENGTH", 4096)
+
+# Login error messages, shared by every failed attempt
+INVALID_CREDENTIALS_MSG = "Invalid credentials"
+DISABLED_ACCOUNT_MSG = "User account is disabled"
+MISSING_CREDENTIALS_MSG = "Must include username and password"
+
+
+@functools.cache
+def _has_user_field(model_class: type) -> bool:
+    """Check once per model class whether it defines a `user` field."""
+    if not hasattr(model_class, "_meta"):
+        return False
+    try:
+        model_class._meta.get_field("user")  # noqa: SLF001
+    except FieldDoesNotExist:
+        return False
+    return True
+
 
 class BaseModelSerializer(serializers.ModelSerializer):
     """
@@ -22,46 +47,45 @@ class BaseModelSerializer(serializers.ModelSerializer):
         # Automatically set user from request context if the model has a user field
         # and it's not already provided in attrs
         request = self.context.get("request")
-        if (
-            request
-            and request.user.is_authenticated
-            and "user" not in attrs
-            and hasattr(self.Meta.model, "_meta")
-        ):
-            try:
-                self.Meta.model._meta.get_field("user")  # noqa: SLF001
-                attrs["user"] = request.user
-            except FieldDoesNotExist:
-                # Field doesn't exist, skip
-                pass
+        if "user" not in attrs and request and _has_user_field(self.Meta.model):
+            user = request.user
+            if user.is_authenticated:
+                attrs["user"] = user
         return super().validate(attrs)
 
 
 class LoginSerializer(serializers.Serializer):
-    username = serializers.CharField()
-    password = serializers.CharField(style={"input_type": "password"})
+    # No account can match a username longer than the model allows
+    username = serializers.CharField(
+        max_length=User._meta.get_field("username").max_length  # noqa: SLF001
+    )
+    password = serializers.CharField(
+        max_length=MAX_PASSWORD_LENGTH,
+        style={"input_type": "password"},
+    )
 
     def validate(self, attrs: dict) -> dict:
         username = attrs.get("username")
         password = attrs.get("password")
 
-        if username and password:
-            user = authenticate(username=username, password=password)
-            if not user:
-                msg = "Invalid credentials"
-                raise serializers.ValidationError(msg)
-            if not user.is_active:
-                msg = "User account is disabled"
-                raise serializers.ValidationError(msg)
-            attrs["user"] = user
-            return attrs
-        msg = "Must include username and password"
-        raise serializers.ValidationError(msg)
+        if not (username and password):
+            raise serializers.ValidationError(MISSING_CREDENTIALS_MSG)
+
+        user = authenticate(username=username, password=password)
+        if not user:
+            raise serializers.ValidationError(INVALID_CREDENTIALS_MSG)
+        if not user.is_active:
+            raise serializers.ValidationError(DISABLED_ACCOUNT_MSG)
+        attrs["user"] = user
+        return attrs
 
 
 class UserSerializer(serializers.ModelSerializer):
     role = serializers.SerializerMethodField()
 
+    # Fields built from User._meta, keyed by serializer class
+    _fields_cache: ClassVar[dict[type, dict[str, serializers.Field]]] = {}
+
     class Meta:
         model = User
         fields: ClassVar[list[str]] = [
@@ -81,6 +105,42 @@ class UserSerializer(serializers.ModelSerializer):
             "role",
         ]
 
+    def get_fields(self) -> dict[str, serializers.Field]:
+        """
+        Build the field mapping once per class and hand out copies.
+
+        UserSerializer is instantiated per row when nested in other
+        representations, so model introspection is skipped after the first
+        build. Fields are unbound templates; each instance gets its own copy
+        to bind, and nested serializers are deep-copied.
+
+        Returns:
+            dict: Fresh field instances for this serializer
+        """
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {
+            name: copy.deepcopy(field)
+            if isinstance(field, serializers.BaseSerializer)
+            else copy.copy(field)
+            for name, field in self._fields_cache[cls].items()
+        }
+
+    @classmethod
+    def setup_eager_loading(cls, queryset: QuerySet, prefix: str = "") -> QuerySet:
+        """
+        Prefetch the groups get_role reads, in one query for all users.
+
+        Args:
+            queryset: Queryset of users, or of rows related to users
+            prefix: Lookup path to the user relation, e.g. "user__"
+
+        Returns:
+            QuerySet: The queryset with user groups prefetched
+        """
+        return queryset.prefetch_related(f"{prefix}groups")
+
     def get_role(self, obj: User) -> str | None:
         """Get user role using the project's role system"""
         return get_user_role(obj)
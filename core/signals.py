@@ -0,0 +1,84 @@
+"""
+Signals for core app.
+
+Keeps the authentication token cache and memoized user roles consistent when
+tokens are revoked or their users change.
+"""
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import token_cache_enabled, token_cache_key
+from .models import MultiDeviceToken
+from .permissions import USER_ROLE_ATTR
+
+
+@receiver(post_delete, sender=MultiDeviceToken)
+def invalidate_token_cache_on_delete(
+    instance: MultiDeviceToken, **_kwargs: object
+) -> None:
+    """Drop a revoked token from the cache so it stops authenticating at once."""
+    if token_cache_enabled():
+        cache.delete(token_cache_key(instance.key))
+
+
+def _drop_cached_tokens(user_ids: Iterable[object]) -> None:
+    """Drop the cached tokens of the given users."""
+    keys = MultiDeviceToken.objects.filter(user__in=user_ids).values_list(
+        "key", flat=True
+    )
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_token_cache_on_user_change(
+    instance: object,
+    update_fields: frozenset[str] | None = None,
+    **_kwargs: object,
+) -> None:
+    """
+    Drop cached tokens of a user whose record changed.
+
+    Cached tokens carry a copy of the user, so deactivations and profile
+    updates must not wait for the cache entries to expire. Nothing is cached
+    while token caching is disabled, and a `last_login` stamp alone cannot
+    change what authentication relies on, so neither costs a query.
+    """
+    if not token_cache_enabled() or update_fields == {"last_login"}:
+        return
+    _drop_cached_tokens([instance.pk])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def reset_memoized_role_on_group_change(
+    instance: object,
+    action: str,
+    pk_set: set[int] | None,
+    **_kwargs: object,
+) -> None:
+    """
+    Forget the roles of users whose group membership changed.
+
+    Roles are memoized on the user, including the copy cached with each
+    token when token caching is enabled on a shared backend, so both the
+    instance and the user's cached tokens are cleared. The token lookup is
+    skipped while token caching is disabled.
+    """
+    if isinstance(instance, User):
+        instance.__dict__.pop(USER_ROLE_ATTR, None)
+    if not token_cache_enabled():
+        return
+    if isinstance(instance, User):
+        if action.startswith("post_"):
+            _drop_cached_tokens([instance.pk])
+    # Changed from the group side: pk_set names the users, except on clear,
+    # where the members must be read before they are removed
+    elif action in ("post_add", "post_remove"):
+        _drop_cached_tokens(pk_set)
+    elif action == "pre_clear":
+        _drop_cached_tokens(list(instance.user_set.values_list("pk", flat=True)))
@@ -5,7 +5,6 @@ student personas. Shared fixtures ensure we only create the necessary objects
 once per class, which keeps the suite fast and avoids repeated boilerplate.
 """
 
-import uuid
 from unittest.mock import Mock, patch
 
 from django.contrib.auth.models import Group, User
@@ -16,61 +15,15 @@ from rest_framework.test import APIClient, APITestCase
 
 from core.context import Role
 from core.permissions import (
+    METHOD_BITS,
     DischargeSummaryPermission,
     MedicationOrderPermission,
+    _resolve_user_role,
+    annotate_user_role,
     get_user_role,
 )
-from patients.models import Patient
-
-
-class RoleFixtureMixin:
-    """Reusable helpers for creating role-aware users and patients."""
-
-    # Intentionally using a fixed test password for fixtures. Marked to ignore S105.
-    DEFAULT_PASSWORD = "test123"  # noqa: S105
-
-    @classmethod
-    def setUpTestData(cls) -> None:
-        super().setUpTestData()
-        cls.role_groups = {
-            Role.ADMIN.value: Group.objects.get_or_create(name=Role.ADMIN.value)[0],
-            Role.INSTRUCTOR.value: Group.objects.get_or_create(
-                name=Role.INSTRUCTOR.value,
-            )[0],
-            Role.STUDENT.value: Group.objects.get_or_create(name=Role.STUDENT.value)[0],
-        }
-
-    @classmethod
-    def create_user(cls, username, role=None, **extra):
-        """Create a user and attach them to the requested role group."""
-
-        user = User.objects.create_user(
-            username=username,
-            password=extra.pop("password", cls.DEFAULT_PASSWORD),
-            **extra,
-        )
-        if role:
-            role_value = role.value if isinstance(role, Role) else role
-            user.groups.add(cls.role_groups[role_value])
-        return user
-
-    @classmethod
-    def create_patient(cls, **overrides):
-        """Create a patient with the new mandatory identifiers populated."""
-
-        suffix = uuid.uuid4().hex[:8]
-        defaults = {
-            "first_name": "Test",
-            "last_name": "Patient",
-            "date_of_birth": "1990-01-01",
-            "gender": Patient.Gender.UNSPECIFIED,
-            "mrn": f"MRN_CORE_{suffix}",
-            "ward": "Ward Core",
-            "bed": "Bed 1",
-            "phone_number": f"+7000{suffix[:6]}",
-        }
-        defaults.update(overrides)
-        return Patient.objects.create(**defaults)
+from core.serializers import MAX_PASSWORD_LENGTH, UserSerializer
+from tests.test_utils import RoleFixtureMixin
 
 
 class CoreUtilsTest(RoleFixtureMixin, TestCase):
@@ -98,6 +51,98 @@ class CoreUtilsTest(RoleFixtureMixin, TestCase):
         assert get_user_role(self.student_user) == Role.STUDENT.value
         assert get_user_role(self.no_role_user) is None
 
+    def test_get_user_role_memoized_on_user(self) -> None:
+        """Test that the role is resolved once per user instance."""
+        user = User.objects.get(pk=self.student_user.pk)
+        assert get_user_role(user) == Role.STUDENT.value
+
+        with self.assertNumQueries(0):
+            assert get_user_role(user) == Role.STUDENT.value
+
+    def test_get_user_role_uses_one_query(self) -> None:
+        """Test that resolving a role takes a single group query."""
+        user = User.objects.get(pk=self.student_user.pk)
+        user.groups.add(self.role_groups[Role.INSTRUCTOR.value])
+        user = User.objects.get(pk=user.pk)
+
+        with self.assertNumQueries(1):
+            assert get_user_role(user) == Role.INSTRUCTOR.value
+
+    def test_get_user_role_uses_prefetched_groups(self) -> None:
+        """Test that prefetched groups resolve the role without a query."""
+        user = User.objects.prefetch_related("groups").get(pk=self.instructor_user.pk)
+
+        with self.assertNumQueries(0):
+            assert get_user_role(user) == Role.INSTRUCTOR.value
+
+    def test_student_group_list_resolves_roles_without_n_plus_one(self) -> None:
+        """Test that listing student groups resolves roles in the list query."""
+        client = APIClient()
+        client.force_authenticate(self.instructor_user)
+        url = "/api/instructors/student-groups/"
+        client.get(url)
+        self.create_user("student2", Role.STUDENT)
+        self.create_user("student3", Role.STUDENT)
+
+        with self.assertNumQueries(1):
+            response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {user["role"] for user in response.json()} == {Role.STUDENT.value}
+
+    def test_annotated_role_matches_get_user_role(self) -> None:
+        """Test that the SQL role annotation follows the role hierarchy."""
+        User.objects.create_superuser(username="annotated_super", password="x")
+        self.no_role_user.groups.add(self.role_groups[Role.STUDENT.value])
+        self.no_role_user.groups.add(self.role_groups[Role.INSTRUCTOR.value])
+
+        for user in annotate_user_role(User.objects.all()):
+            with self.assertNumQueries(0):
+                role = get_user_role(user)
+            assert role == _resolve_user_role(user), user.username
+
+    def test_get_user_role_reset_on_group_change(self) -> None:
+        """Test that changing groups clears the memoized role."""
+        user = User.objects.get(pk=self.no_role_user.pk)
+        assert get_user_role(user) is None
+
+        user.groups.add(self.role_groups[Role.INSTRUCTOR.value])
+
+        assert get_user_role(user) == Role.INSTRUCTOR.value
+
+    def test_group_change_skips_token_lookup_while_cache_disabled(self) -> None:
+        """Test that group changes do not query tokens when nothing is cached."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from core.models import MultiDeviceToken
+
+        user = User.objects.get(pk=self.no_role_user.pk)
+        group = self.role_groups[Role.STUDENT.value]
+        token_table = MultiDeviceToken._meta.db_table  # noqa: SLF001
+
+        with CaptureQueriesContext(connection) as queries:
+            user.groups.add(group)
+            group.user_set.remove(user)
+            group.user_set.clear()
+
+        assert not [q for q in queries.captured_queries if token_table in q["sql"]]
+
+    def test_user_serializer_builds_fields_once(self) -> None:
+        """Test that UserSerializer reuses its model fields across instances."""
+        UserSerializer(self.student_user).data  # noqa: B018
+
+        with patch(
+            "rest_framework.serializers.ModelSerializer.get_fields"
+        ) as mocked_get_fields:
+            first = UserSerializer(self.student_user).data
+            second = UserSerializer(self.instructor_user).data
+
+        mocked_get_fields.assert_not_called()
+        assert first["username"] == self.student_user.username
+        assert first["role"] == Role.STUDENT.value
+        assert second["role"] == Role.INSTRUCTOR.value
+
     def test_superuser_is_admin(self) -> None:
         """Test that a superuser is automatically considered an admin."""
         superuser = User.objects.create_superuser(username="super", password="test123")
@@ -194,6 +239,147 @@ class AuthenticationTest(APITestCase):
         profile2 = self.client.get(reverse("auth-profile"))
         assert profile2.status_code == status.HTTP_200_OK
 
+    @patch("core.authentication.TOKEN_CACHE_TTL", 60)
+    @patch("core.cache.CacheManager.is_shared_backend", new=lambda: True)
+    def test_token_validation_is_cached(self) -> None:
+        """Test that a validated token skips the database on the next request"""
+        from core.authentication import MultiDeviceTokenAuthentication
+        from core.models import MultiDeviceToken
+
+        token = MultiDeviceToken.objects.create(user=self.test_user)
+        authentication = MultiDeviceTokenAuthentication()
+        authentication.authenticate_credentials(token.key)
+
+        with self.assertNumQueries(0):
+            user, cached_token = authentication.authenticate_credentials(token.key)
+
+        assert user == self.test_user
+        assert cached_token.key == token.key
+
+    @patch("core.authentication.TOKEN_CACHE_TTL", 60)
+    @patch("core.cache.CacheManager.is_shared_backend", new=lambda: True)
+    def test_cached_token_carries_role_until_groups_change(self) -> None:
+        """Test that cached tokens skip role queries and are dropped on group changes"""
+        from core.authentication import MultiDeviceTokenAuthentication
+        from core.models import MultiDeviceToken
+
+        token = MultiDeviceToken.objects.create(user=self.test_user)
+        authentication = MultiDeviceTokenAuthentication()
+        authentication.authenticate_credentials(token.key)
+
+        with self.assertNumQueries(0):
+            user, _ = authentication.authenticate_credentials(token.key)
+            assert get_user_role(user) == Role.STUDENT.value
+
+        instructor_group = Group.objects.get_or_create(name=Role.INSTRUCTOR.value)[0]
+        instructor_group.user_set.add(self.test_user)
+
+        user, _ = authentication.authenticate_credentials(token.key)
+        assert get_user_role(user) == Role.INSTRUCTOR.value
+
+    @patch("core.authentication.TOKEN_CACHE_TTL", 60)
+    @patch("core.cache.CacheManager.is_shared_backend", new=lambda: True)
+    def test_deactivated_user_token_rejected_despite_cache(self) -> None:
+        """Test that deactivating a user invalidates their cached tokens"""
+        user = User.objects.create_user(username="deactivated", password="test123")
+        response = self.client.post(
+            reverse("auth-login"),
+            {"username": "deactivated", "password": "test123"},
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {response.data['token']}")
+        assert self.client.get(reverse("auth-profile")).status_code == (
+            status.HTTP_200_OK
+        )
+
+        user.is_active = False
+        user.save()
+
+        profile = self.client.get(reverse("auth-profile"))
+        assert profile.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revoked_token_rejected_by_other_workers(self) -> None:
+        """Test that a token revoked elsewhere stops authenticating at once"""
+        from rest_framework import exceptions
+
+        from core.authentication import MultiDeviceTokenAuthentication
+        from core.models import MultiDeviceToken
+
+        token = MultiDeviceToken.objects.create(user=self.test_user)
+        key = token.key
+        authentication = MultiDeviceTokenAuthentication()
+        authentication.authenticate_credentials(key)
+
+        # Revoke as another worker would, leaving this process's cache alone
+        with patch("core.signals.cache"):
+            token.delete()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            authentication.authenticate_credentials(key)
+
+    def test_demoted_role_applies_on_other_workers(self) -> None:
+        """Test that a group removal elsewhere is seen on the next request"""
+        from core.authentication import MultiDeviceTokenAuthentication
+        from core.models import MultiDeviceToken
+
+        instructor_group = Group.objects.get_or_create(name=Role.INSTRUCTOR.value)[0]
+        user = User.objects.create_user(username="demoted", password="test123")
+        user.groups.add(instructor_group)
+        token = MultiDeviceToken.objects.create(user=user)
+        authentication = MultiDeviceTokenAuthentication()
+        authenticated, _ = authentication.authenticate_credentials(token.key)
+        assert get_user_role(authenticated) == Role.INSTRUCTOR.value
+
+        # Demote as another worker would, leaving this process's cache alone
+        with patch("core.signals.cache"):
+            instructor_group.user_set.remove(user)
+
+        authenticated, _ = authentication.authenticate_credentials(token.key)
+        assert get_user_role(authenticated) is None
+
+    def test_login_skips_token_cache_work_while_disabled(self) -> None:
+        """Test that logins and user saves cost no token cache queries by default"""
+        user = User.objects.create_user(username="quiet", password="test123")
+        self.client.post(
+            reverse("auth-login"), {"username": "quiet", "password": "test123"}
+        )
+
+        # User lookup, token insert and the role lookup for the response
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                reverse("auth-login"), {"username": "quiet", "password": "test123"}
+            )
+        assert response.status_code == status.HTTP_200_OK
+
+        with self.assertNumQueries(1):
+            user.save()
+
+    @patch("core.authentication.TOKEN_CACHE_TTL", 60)
+    @patch("core.cache.CacheManager.is_shared_backend", new=lambda: True)
+    def test_last_login_stamp_keeps_cached_tokens(self) -> None:
+        """Test that saving only last_login does not look up the user's tokens"""
+        from django.contrib.auth.models import update_last_login
+
+        with self.assertNumQueries(1):
+            update_last_login(None, self.test_user)
+
+        with self.assertNumQueries(2):
+            self.test_user.save(update_fields=["is_active"])
+
+    def test_login_rejects_oversized_input_before_hashing(self) -> None:
+        """Test that over-long credentials fail without an authenticate() call."""
+        url = reverse("auth-login")
+        oversized = [
+            {"username": "u" * 151, "password": "test123"},
+            {"username": "testuser", "password": "p" * (MAX_PASSWORD_LENGTH + 1)},
+        ]
+
+        with patch("core.serializers.authenticate") as mocked_authenticate:
+            for payload in oversized:
+                response = self.client.post(url, payload)
+                assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        mocked_authenticate.assert_not_called()
+
     def test_login_returns_user_info(self) -> None:
         """Test that login returns both token and user information"""
         response = self.client.post(
@@ -234,9 +420,9 @@ class _BasePermissionBehaviorTest(RoleFixtureMixin, TestCase):
     def setUp(self) -> None:
         self.permission = self.permission_class()
         self.owned_obj = Mock()
-        self.owned_obj.user = self.student
+        self.owned_obj.user_id = self.student.pk
         self.other_obj = Mock()
-        self.other_obj.user = self.other_student
+        self.other_obj.user_id = self.other_student.pk
 
     def _build_request(self, user, method: str):
         request = Mock()
@@ -267,7 +453,7 @@ class _BasePermissionBehaviorTest(RoleFixtureMixin, TestCase):
         """Objects without ownership metadata must be rejected for students."""
 
         anonymous_obj = Mock()
-        delattr(anonymous_obj, "user")
+        delattr(anonymous_obj, "user_id")
         request = self._build_request(self.student, "GET")
 
         assert not self.permission.has_object_permission(
@@ -301,18 +487,29 @@ class _BasePermissionBehaviorTest(RoleFixtureMixin, TestCase):
             self.owned_obj,
         )
 
+    def test_method_masks_match_role_permissions(self) -> None:
+        """Compiled method masks must allow exactly the declared methods."""
+
+        for role, methods in self.permission_class.role_permissions.items():
+            for method in ("GET", "POST", "PUT", "PATCH", "DELETE", "TRACE"):
+                with self.subTest(role=role, method=method):
+                    mask = self.permission_class._role_masks[role]  # noqa: SLF001
+                    allowed = bool(mask & METHOD_BITS.get(method, 0))
+                    assert allowed == (method in methods)
+
     def test_role_lookup_cached_after_first_access(self) -> None:
-        """BaseRolePermission should memoise role lookups per username."""
+        """Role lookups should be shared by every permission check in a request."""
 
-        request = self._build_request(self.student, "GET")
+        request = self._build_request(User.objects.get(pk=self.student.pk), "GET")
 
         with patch(
-            "core.permissions.get_user_role", return_value=Role.STUDENT.value
+            "core.permissions._resolve_user_role", return_value=Role.STUDENT.value
         ) as mocked_role:
             assert self.permission.has_permission(request, None)
             assert self.permission.has_permission(request, None)
+            assert self.permission_class().has_permission(request, None)
 
-        # Two permission checks should only trigger one expensive role lookup.
+        # Repeated checks, even from other permission instances, resolve once.
         assert mocked_role.call_count == 1
 
 
@@ -44,9 +44,11 @@ class AuthViewSet(viewsets.GenericViewSet):
         # Create a new token for each login to support multi-device access
         token = MultiDeviceToken.objects.create(user=user)
 
-        response_data = {"token": token.key, "user": UserSerializer(user).data}
+        # Build the payload through the documented response serializer so the
+        # user shape is defined once and shared with the profile endpoint
+        response_serializer = AuthTokenSerializer({"token": token.key, "user": user})
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
 
     @extend_schema(
         summary="User logout",
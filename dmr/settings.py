@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -146,6 +147,12 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The test suite never relies on password hash strength, so it uses a fast
+# hasher instead of paying the production PBKDF2 cost for every test user
+TESTING = sys.argv[1:2] == ["test"]
+if TESTING:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
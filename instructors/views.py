@@ -1,11 +1,11 @@
 from typing import Any, ClassVar
 
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 from rest_framework import viewsets
 
 from core.context import Role
-from core.permissions import StudentGroupPermission
+from core.permissions import StudentGroupPermission, annotate_user_role
 from core.serializers import UserSerializer
 
 
@@ -17,8 +17,25 @@ class StudentGroupViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = None
 
     def get_queryset(self) -> QuerySet:
-        return (
-            User.objects.filter(groups__name=Role.STUDENT.value)
+        # Match student accounts with EXISTS rather than a join, which would
+        # need distinct(); annotate roles so UserSerializer.get_role resolves
+        # every user's role without a query per user
+        is_student = Exists(
+            User.groups.through.objects.filter(
+                user=OuterRef("pk"), group__name=Role.STUDENT.value
+            )
+        )
+        return annotate_user_role(
+            User.objects
+            .filter(is_student)
+            .only(
+                "id",
+                "username",
+                "email",
+                "first_name",
+                "last_name",
+                "is_staff",
+                "is_superuser",
+            )
             .order_by("username")
-            .distinct()
         )
@@ -13,61 +13,12 @@ from rest_framework.test import APIClient, APITestCase
 
 from core.context import Role
 from student_groups.models import ApprovedFile, ImagingRequest
+from tests.test_utils import RoleFixtureMixin
 
 from .models import File, GoogleFormLink, Patient
 from .services.pdf_pagination import PdfPaginationService
 
 
-class RoleFixtureMixin:
-    """Reusable helpers for creating role-aware users and patients."""
-
-    # Intentionally using a fixed test password for fixtures. Marked to ignore S105.
-    DEFAULT_PASSWORD = "test123"  # noqa: S105
-
-    @classmethod
-    def setUpTestData(cls) -> None:
-        super().setUpTestData()
-        cls.role_groups = {
-            Role.ADMIN.value: Group.objects.get_or_create(name=Role.ADMIN.value)[0],
-            Role.INSTRUCTOR.value: Group.objects.get_or_create(
-                name=Role.INSTRUCTOR.value,
-            )[0],
-            Role.STUDENT.value: Group.objects.get_or_create(name=Role.STUDENT.value)[0],
-        }
-
-    @classmethod
-    def create_user(cls, username, role=None, **extra):
-        """Create a user and attach them to the requested role group."""
-
-        user = get_user_model().objects.create_user(
-            username=username,
-            password=extra.pop("password", cls.DEFAULT_PASSWORD),
-            **extra,
-        )
-        if role:
-            role_value = role.value if isinstance(role, Role) else role
-            user.groups.add(cls.role_groups[role_value])
-        return user
-
-    @classmethod
-    def create_patient(cls, **overrides):
-        """Create a patient with the new mandatory identifiers populated."""
-
-        suffix = uuid4().hex[:8]
-        defaults = {
-            "first_name": "Test",
-            "last_name": "Patient",
-            "date_of_birth": "1990-01-01",
-            "gender": Patient.Gender.UNSPECIFIED,
-            "mrn": f"MRN_CORE_{suffix}",
-            "ward": "Ward Core",
-            "bed": "Bed 1",
-            "phone_number": f"+7000{suffix[:6]}",
-        }
-        defaults.update(overrides)
-        return Patient.objects.create(**defaults)
-
-
 @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
 class PatientApiTests(APITestCase, RoleFixtureMixin):
     @classmethod
@@ -698,6 +649,23 @@ class FileManagementTestCase(APITestCase):
         # Should NOT see Imaging file (not approved)
         assert str(imaging_file.id) not in file_ids
 
+    def test_student_file_list_filters_approvals_in_a_subquery(self) -> None:
+        """Test that approved files are matched inside the file list query."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_authenticate(user=self.student_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self._get_file_list_url())
+
+        assert response.status_code == status.HTTP_200_OK
+        approval_queries = [
+            q["sql"] for q in queries if "student_groups_approvedfile" in q["sql"]
+        ]
+        assert approval_queries
+        assert all("patients_file" in sql for sql in approval_queries)
+
     def test_student_can_see_approved_files_from_completed_requests(self) -> None:
         """Test that student can see files approved in their completed lab requests."""
         self.client.force_authenticate(user=self.student_user)
@@ -826,14 +794,8 @@ class FileUploadMultipartParserTests(APITestCase):
         )
         cls.instructor_user.groups.add(cls.instructor_group)
 
-    def setUp(self) -> None:
-        """Set up test fixtures for each test method."""
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.instructor_user)
-        self.media_root = settings.MEDIA_ROOT
-
         # Create test patient
-        self.patient = Patient.objects.create(
+        cls.patient = Patient.objects.create(
             first_name="Test",
             last_name="Patient",
             date_of_birth="1990-01-01",
@@ -842,6 +804,12 @@ class FileUploadMultipartParserTests(APITestCase):
             bed="Bed 2",
         )
 
+    def setUp(self) -> None:
+        """Set up test fixtures for each test method."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.instructor_user)
+        self.media_root = settings.MEDIA_ROOT
+
     @classmethod
     def tearDownClass(cls) -> None:
         """Clean up after all tests in this class."""
@@ -1062,23 +1030,22 @@ class GoogleFormLinkApiTests(APITestCase):
         )
         cls.student_user.groups.add(cls.student_group)
 
-    def setUp(self) -> None:
         # Create test Google Form links
-        self.form1 = GoogleFormLink.objects.create(
+        cls.form1 = GoogleFormLink.objects.create(
             title="Patient Feedback Form",
             url="https://forms.google.com/feedback",
             description="Please provide your feedback",
             display_order=1,
             is_active=True,
         )
-        self.form2 = GoogleFormLink.objects.create(
+        cls.form2 = GoogleFormLink.objects.create(
             title="Health Survey",
             url="https://forms.google.com/health-survey",
             description="Complete this health survey",
             display_order=2,
             is_active=True,
         )
-        self.inactive_form = GoogleFormLink.objects.create(
+        cls.inactive_form = GoogleFormLink.objects.create(
             title="Inactive Form",
             url="https://forms.google.com/inactive",
             description="This form is inactive",
@@ -1339,6 +1306,22 @@ class FilePermissionsTest(RoleFixtureMixin, APITestCase):
             self.mock_request, self.mock_view, self.file
         )
 
+    def test_student_file_access_checked_in_one_query(self) -> None:
+        """Test that a manual release grants access with a single approval query."""
+        from core.permissions import FileAccessPermission, get_user_role
+
+        permission = FileAccessPermission()
+        self.mock_request.user = self.student_user
+        self.mock_request.method = "GET"
+        get_user_role(self.student_user)
+
+        ApprovedFile.objects.create(file=self.file, released_to_user=self.student_user)
+
+        with self.assertNumQueries(1):
+            assert permission.has_object_permission(
+                self.mock_request, self.mock_view, self.file
+            )
+
     def test_instructor_safe_methods_allowed(self) -> None:
         """Instructors should have permission for safe HTTP methods."""
         from core.permissions import FileAccessPermission
@@ -16,6 +16,7 @@ from core.permissions import (
     FileAccessPermission,
     GoogleFormLinkPermission,
     PatientPermission,
+    approved_file_filter,
     get_user_role,
 )
 from student_groups.models import ApprovedFile
@@ -50,6 +51,8 @@ class PatientViewSet(CacheMixin, viewsets.ModelViewSet):
     cache_key_params: ClassVar[list[str]] = []
     cache_invalidate_params: ClassVar[list[str]] = ["id"]
     cache_user_sensitive: ClassVar[bool] = False
+    # Patient records are read constantly and edited rarely
+    cache_adaptive_ttl: ClassVar[bool] = True
 
 
 class FileViewSet(CacheMixin, viewsets.ModelViewSet):
@@ -95,15 +98,7 @@ class FileViewSet(CacheMixin, viewsets.ModelViewSet):
             if user_role == Role.STUDENT.value:
                 # Get files from approved lab requests for this student
                 approved_file_ids = ApprovedFile.objects.filter(
-                    Q(
-                        imaging_request__user=self.request.user,
-                        imaging_request__status="completed",
-                    )
-                    | Q(
-                        blood_test_request__user=self.request.user,
-                        blood_test_request__status="completed",
-                    )
-                    | Q(released_to_user=self.request.user)
+                    approved_file_filter(self.request.user)
                 ).values_list("file_id", flat=True)
 
                 # Filter: Admission category OR in approved files
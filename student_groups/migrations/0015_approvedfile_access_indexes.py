@@ -0,0 +1,26 @@
+from typing import ClassVar
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies: ClassVar[list[tuple[str, str]]] = [
+        ("student_groups", "0014_remove_old_test_type_field"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="approvedfile",
+            index=models.Index(
+                fields=["file", "imaging_request"],
+                name="approved_file_imaging_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="approvedfile",
+            index=models.Index(
+                fields=["file", "blood_test_request"],
+                name="approved_file_blood_test_idx",
+            ),
+        ),
+    ]
@@ -550,6 +550,18 @@ class ApprovedFile(models.Model):
                 name="unique_manual_file_release",
             ),
         ]
+        # Student file access probes by file and source; manual releases are
+        # already covered by the unique_manual_file_release index
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(
+                fields=["file", "imaging_request"],
+                name="approved_file_imaging_idx",
+            ),
+            models.Index(
+                fields=["file", "blood_test_request"],
+                name="approved_file_blood_test_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         if self.imaging_request:
@@ -41,13 +41,15 @@ def invalidate_file_cache_on_approved_file_change(
 
     if patient_id and affected_user_ids:
         # Invalidate file caches for this patient and specific users
+        keys_to_invalidate: list[str] = []
         for user_id in affected_user_ids:
-            keys_to_invalidate = CacheKeyGenerator.generate_invalidation_keys(
-                "patients",
-                "files",
-                patient_id=patient_id,
-                user_id=user_id,
+            keys_to_invalidate.extend(
+                CacheKeyGenerator.generate_invalidation_keys(
+                    "patients",
+                    "files",
+                    patient_id=patient_id,
+                    user_id=user_id,
+                )
             )
 
-            for key in keys_to_invalidate:
-                CacheManager.invalidate_cache(key)
+        CacheManager.invalidate_cache(keys_to_invalidate)
@@ -1,15 +1,14 @@
 from copy import deepcopy
 
-from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
 from core.cache import CacheManager
 from core.context import Role
-from patients.models import Patient
 from student_groups.models import (
     BloodPressure,
     BloodSugar,
@@ -22,50 +21,7 @@ from student_groups.models import (
 )
 from student_groups.serializers import NoteSerializer
 from student_groups.validators import ObservationValidator
-
-
-class RoleFixtureMixin:
-    """Reusable helpers for creating role-aware users and patients."""
-
-    DEFAULT_PASSWORD = "test123"  # noqa: S105 - shared test credential
-
-    @classmethod
-    def setUpTestData(cls) -> None:
-        super().setUpTestData()
-        cls.role_groups = {
-            Role.ADMIN.value: Group.objects.get_or_create(name=Role.ADMIN.value)[0],
-            Role.INSTRUCTOR.value: Group.objects.get_or_create(
-                name=Role.INSTRUCTOR.value,
-            )[0],
-            Role.STUDENT.value: Group.objects.get_or_create(name=Role.STUDENT.value)[0],
-        }
-
-    @classmethod
-    def create_user(cls, username: str, role: Role | str):
-        user = get_user_model().objects.create_user(
-            username=username,
-            password=cls.DEFAULT_PASSWORD,
-        )
-        role_value = role.value if isinstance(role, Role) else role
-        user.groups.add(cls.role_groups[role_value])
-        return user
-
-    @classmethod
-    def create_patient(cls, **overrides):
-        defaults = {
-            "first_name": "Test",
-            "last_name": "Patient",
-            "date_of_birth": "1990-01-01",
-            "gender": Patient.Gender.UNSPECIFIED,
-            "mrn": overrides.get(
-                "mrn", f"MRN_SG_{get_user_model().objects.count():04d}"
-            ),
-            "ward": overrides.get("ward", "Ward SG"),
-            "bed": overrides.get("bed", "Bed 1"),
-            "phone_number": overrides.get("phone_number", "+61123456789"),
-        }
-        defaults.update(overrides)
-        return Patient.objects.create(**defaults)
+from tests.test_utils import RoleFixtureMixin
 
 
 class ObservationValidatorTest(RoleFixtureMixin, TestCase):
@@ -283,6 +239,23 @@ class ObservationsViewSetTest(RoleFixtureMixin, APITestCase):
         assert response_invalid.status_code == status.HTTP_200_OK
         assert len(response_invalid.data["results"]["blood_pressures"]) == 3
 
+    def test_list_serves_cached_rendered_json(self) -> None:
+        HeartRate.objects.create(
+            patient=self.patient,
+            user=self.student,
+            heart_rate=72,
+        )
+        params = {"patient": self.patient.id}
+        first = self.client.get("/api/student-groups/observations/", params)
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/student-groups/observations/", params)
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second["Content-Type"] == "application/json"
+        assert second.content == first.content
+        assert len(second.json()["results"]["heart_rates"]) == 1
+
     def test_create_with_nested_payload_does_not_raise_keyerror(self) -> None:
         payload = {
             "blood_pressure": {
@@ -301,6 +274,33 @@ class ObservationsViewSetTest(RoleFixtureMixin, APITestCase):
         # Confirm that created object's user is the authenticated user (not the passed id)
         assert response.data["blood_pressure"]["user"] == self.student.id
 
+    def test_bulk_create_invalidates_per_type_list_cache(self) -> None:
+        url = "/api/student-groups/observations/blood-pressures/"
+        BloodPressure.objects.create(
+            patient=self.patient,
+            user=self.student,
+            systolic=110,
+            diastolic=70,
+        )
+        CacheManager.invalidate_cache("student_groups:blood_pressures:list:*")
+        before = self.client.get(url, {"patient": self.patient.id})
+        assert before.json()["count"] == 1
+
+        self.client.post(
+            "/api/student-groups/observations/",
+            {
+                "blood_pressure": {
+                    "patient": self.patient.id,
+                    "systolic": 120,
+                    "diastolic": 80,
+                }
+            },
+            format="json",
+        )
+
+        after = self.client.get(url, {"patient": self.patient.id})
+        assert after.json()["count"] == 2
+
 
 class InvestigationRequestRBACIntegrationTest(RoleFixtureMixin, APITestCase):
     @classmethod
@@ -398,6 +398,32 @@ class InvestigationRequestRBACIntegrationTest(RoleFixtureMixin, APITestCase):
         assert bad_response.status_code == status.HTTP_400_BAD_REQUEST
         assert "user" in bad_response.data
 
+    def test_instructor_list_loads_user_roles_in_one_query(self) -> None:
+        for index, student in enumerate((self.student, self.other_student)):
+            ImagingRequest.objects.create(
+                patient=self.patient,
+                user=student,
+                test_type="X-ray",
+                details=f"Request {index}",
+                infection_control_precautions=ImagingRequest.InfectionControlPrecaution.NONE,
+                imaging_focus="Chest",
+                name=f"Request {index}",
+                role="Medical Student",
+            )
+
+        self.client.force_authenticate(self.instructor)
+        url = "/api/student-groups/imaging-requests/"
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        # The instructor's own role, then one prefetch for every listed user
+        group_queries = [q for q in queries if '"auth_group"' in q["sql"]]
+        assert len(group_queries) == 2
+        assert response.status_code == status.HTTP_200_OK
+        assert {item["user"]["role"] for item in response.data["results"]} == {
+            Role.STUDENT.value
+        }
+
     def test_invalid_patient_query_returns_error(self) -> None:
         self.client.force_authenticate(self.instructor)
         response = self.client.get(
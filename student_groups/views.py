@@ -2,10 +2,12 @@ from typing import Any, ClassVar
 
 from django.core.exceptions import ValidationError
 from django.db.models import QuerySet
+from django.http import HttpResponse
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError as DRFValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
@@ -19,6 +21,7 @@ from core.permissions import (
     ObservationPermission,
     get_user_role,
 )
+from core.serializers import UserSerializer
 
 from .models import (
     BloodPressure,
@@ -123,6 +126,8 @@ class BaseInvestigationRequestViewSet(CacheMixin, viewsets.ModelViewSet):
     cache_key_params: ClassVar[list[str]] = ["patient", "user"]
     cache_invalidate_params: ClassVar[list[str]] = ["patient_id"]
     cache_user_sensitive: ClassVar[bool] = True
+    # Set when instructor responses nest UserSerializer for each request
+    eager_load_user_roles: ClassVar[bool] = False
 
     def get_queryset(self) -> QuerySet:
         """Apply role-aware filtering for investigation requests."""
@@ -132,6 +137,10 @@ class BaseInvestigationRequestViewSet(CacheMixin, viewsets.ModelViewSet):
         if user_role == Role.STUDENT.value:
             queryset = queryset.filter(user=self.request.user)
         elif user_role in {Role.INSTRUCTOR.value, Role.ADMIN.value}:
+            # Nested users report their role; load every user's groups at once
+            if self.eager_load_user_roles:
+                queryset = UserSerializer.setup_eager_loading(queryset, "user__")
+
             # Instructors and admins can see all requests, or filter by specific user
             user_param = self.request.query_params.get("user")
             if user_param is not None:
@@ -227,8 +236,15 @@ class ObservationsViewSet(viewsets.GenericViewSet):
         if serializer.is_valid():
             try:
                 created_objects = serializer.save()
-                # Invalidate cache for observations list
-                CacheManager.invalidate_cache(["student_groups:observations:list:*"])
+                # Invalidate the combined observations list and the list of
+                # every per-type endpoint that received a record, in one batch
+                CacheManager.invalidate_cache([
+                    "student_groups:observations:list:*",
+                    *(
+                        f"student_groups:{OBSERVATION_CACHE_MODELS[obs_type]}:list:*"
+                        for obs_type in created_objects
+                    ),
+                ])
             except ValidationError as e:
                 # Use DRF standard 'detail' for error messages
                 return Response(
@@ -272,7 +288,9 @@ class ObservationsViewSet(viewsets.GenericViewSet):
         ],
         responses={200: ObservationDataSerializer},
     )
-    def list(self, request: Request, *_args: object, **_kwargs: object) -> Response:
+    def list(
+        self, request: Request, *_args: object, **_kwargs: object
+    ) -> Response | HttpResponse:
         """
         Retrieve all observations for a specific patient across all observation types.
 
@@ -313,13 +331,16 @@ class ObservationsViewSet(viewsets.GenericViewSet):
             "student_groups", "observations", "list", **cache_params
         )
 
-        # Try cache
-        cached_data = CacheManager.get_cached(cache_key)
-        if cached_data is not None:
-            # Use custom pagination class to wrap cached data
-            paginator = ObservationsPagination()
-            paginator.total_count = cached_data["total_count"]
-            return paginator.get_paginated_response(cached_data["data"])
+        # Cached entries hold the rendered JSON, so only JSON clients use them
+        use_cache = isinstance(
+            getattr(request, "accepted_renderer", None), JSONRenderer
+        )
+        if use_cache:
+            cached_content = CacheManager.get_cached(cache_key)
+            if cached_content is not None:
+                return HttpResponse(
+                    cached_content, content_type=JSONRenderer.media_type
+                )
 
         # Get observations (automatically ordered by model default)
         observations = ObservationManager.get_observations_by_user_and_patient(
@@ -341,14 +362,16 @@ class ObservationsViewSet(viewsets.GenericViewSet):
         total_count = sum(len(obs_list) for obs_list in observations.values())
         paginator.total_count = total_count
 
-        # Cache the response
-        cache_data = {
-            "data": serializer.data,
-            "total_count": total_count,
-        }
-        CacheManager.set_cached(cache_key, cache_data)
+        response = paginator.get_paginated_response(serializer.data)
 
-        return paginator.get_paginated_response(serializer.data)
+        # Cache the rendered response and send the same bytes now
+        if use_cache:
+            content = JSONRenderer().render(response.data)
+            CacheManager.set_cached(cache_key, content)
+            response.content = content
+            response["Content-Type"] = JSONRenderer.media_type
+
+        return response
 
 
 class NoteViewSet(BaseObservationViewSet):
@@ -415,12 +438,26 @@ class PainScoreViewSet(BaseObservationViewSet):
     cache_model: str = "pain_scores"
 
 
+# cache_model of each per-type observation endpoint, keyed by the field name
+# used in bulk observation payloads
+OBSERVATION_CACHE_MODELS = {
+    "blood_pressure": BloodPressureViewSet.cache_model,
+    "heart_rate": HeartRateViewSet.cache_model,
+    "body_temperature": BodyTemperatureViewSet.cache_model,
+    "respiratory_rate": RespiratoryRateViewSet.cache_model,
+    "blood_sugar": BloodSugarViewSet.cache_model,
+    "oxygen_saturation": OxygenSaturationViewSet.cache_model,
+    "pain_score": PainScoreViewSet.cache_model,
+}
+
+
 class ImagingRequestViewSet(BaseInvestigationRequestViewSet):
     """Unified imaging request API for students and instructors."""
 
     queryset = ImagingRequest.objects.select_related("user", "patient")
     serializer_class = ImagingRequestSerializer
     cache_model: str = "imaging_requests"
+    eager_load_user_roles: ClassVar[bool] = True
 
     def get_serializer_class(self) -> type[Serializer]:
         if self.action in {"update", "partial_update"}:
@@ -482,6 +519,7 @@ class BloodTestRequestViewSet(BaseInvestigationRequestViewSet):
     queryset = BloodTestRequest.objects.select_related("user", "patient")
     serializer_class = BloodTestRequestSerializer
     cache_model: str = "blood_test_requests"
+    eager_load_user_roles: ClassVar[bool] = True
 
     def get_serializer_class(self) -> type[Serializer]:
         if self.action in {"update", "partial_update"}:
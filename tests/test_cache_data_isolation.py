@@ -32,31 +32,35 @@ User = get_user_model()
 class PatientEndpointDataIsolationTest(APITestCase):
     """Test that patient endpoints properly isolate data between users via caching"""
 
-    def setUp(self) -> None:
-        """Set up test users"""
-        cache.clear()
-        self.student1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test users once per class"""
+        cls.student1 = User.objects.create_user(
             username="student1",
             email="student1@test.com",
             password="testpass123",
         )
-        self.student2 = User.objects.create_user(
+        cls.student2 = User.objects.create_user(
             username="student2",
             email="student2@test.com",
             password="testpass123",
         )
-        self.instructor = User.objects.create_user(
+        cls.instructor = User.objects.create_user(
             username="instructor1",
             email="instructor1@test.com",
             password="testpass123",
         )
         # Set roles
-        self.student1.role = "student"
-        self.student1.save()
-        self.student2.role = "student"
-        self.student2.save()
-        self.instructor.role = "instructor"
-        self.instructor.save()
+        cls.student1.role = "student"
+        cls.student1.save()
+        cls.student2.role = "student"
+        cls.student2.save()
+        cls.instructor.role = "instructor"
+        cls.instructor.save()
+
+    def setUp(self) -> None:
+        """Clear the cache before each test"""
+        cache.clear()
 
     def test_patient_cache_keys_same_for_same_user(self) -> None:
         """Test that same user gets same cache keys"""
@@ -120,20 +124,24 @@ class PatientEndpointDataIsolationTest(APITestCase):
 class ObservationDataIsolationTest(APITestCase):
     """Test that observation endpoints properly isolate data between users"""
 
-    def setUp(self) -> None:
-        """Set up test users"""
-        cache.clear()
-        self.student1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test users once per class"""
+        cls.student1 = User.objects.create_user(
             username="obs_student1",
             email="obs_student1@test.com",
             password="testpass123",
         )
-        self.student2 = User.objects.create_user(
+        cls.student2 = User.objects.create_user(
             username="obs_student2",
             email="obs_student2@test.com",
             password="testpass123",
         )
 
+    def setUp(self) -> None:
+        """Clear the cache before each test"""
+        cache.clear()
+
     def test_observation_cache_keys_include_user_id(self) -> None:
         """Test that observation cache keys include user ID for isolation"""
         # BaseObservationViewSet has cache_user_sensitive=True
@@ -192,20 +200,24 @@ class ObservationDataIsolationTest(APITestCase):
 class InvestigationRequestDataIsolationTest(APITestCase):
     """Test that investigation request endpoints properly isolate data between users"""
 
-    def setUp(self) -> None:
-        """Set up test users"""
-        cache.clear()
-        self.student1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test users once per class"""
+        cls.student1 = User.objects.create_user(
             username="inv_student1",
             email="inv_student1@test.com",
             password="testpass123",
         )
-        self.student2 = User.objects.create_user(
+        cls.student2 = User.objects.create_user(
             username="inv_student2",
             email="inv_student2@test.com",
             password="testpass123",
         )
 
+    def setUp(self) -> None:
+        """Clear the cache before each test"""
+        cache.clear()
+
     def test_investigation_request_cache_keys_include_user_id(self) -> None:
         """Test that investigation request cache keys include user ID"""
         # BaseInvestigationRequestViewSet has cache_user_sensitive=True
@@ -10,12 +10,15 @@ Tests cover:
 5. Multi-user cache isolation
 """
 
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.test import TestCase, override_settings
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 
-from core.cache import CacheKeyGenerator, CacheManager
+from core.cache import CacheKeyGenerator, CacheManager, CacheParamBuilder
 
 User = get_user_model()
 
@@ -27,6 +30,31 @@ class CacheKeyGeneratorTest(TestCase):
         """Clear cache before each test"""
         cache.clear()
 
+    def test_param_names_cannot_forge_separators(self) -> None:
+        """Test that control characters in a param name cannot forge another key"""
+        key1 = CacheKeyGenerator.generate_key(
+            "patients", "patients", "list", a="1", b="2", c="3"
+        )
+        key2 = CacheKeyGenerator.generate_key(
+            "patients", "patients", "list", **{"a\x1f'1'\x1eb": "2", "c": "3"}
+        )
+
+        assert key1 != key2
+
+    def test_unsafe_param_names_are_hashed(self) -> None:
+        """Test that only short word-character param names appear in keys"""
+        for name in ("a b\n:*", "x" * 5000):
+            key = CacheKeyGenerator.generate_key(
+                "patients", "patients", "list", **{name: "1"}
+            )
+            assert name not in key
+            assert len(key) <= len("patients:patients:list:") + 16
+
+        key = CacheKeyGenerator.generate_key(
+            "patients", "patients", "list", page_size="1"
+        )
+        assert key == "patients:patients:list:page_size_1"
+
     def test_consistent_key_generation_with_parameter_order(self) -> None:
         """Test that parameter order doesn't affect key generation"""
         key1 = CacheKeyGenerator.generate_key(
@@ -38,6 +66,53 @@ class CacheKeyGeneratorTest(TestCase):
 
         assert key1 == key2, "Keys should be identical regardless of parameter order"
 
+    def test_hash_params_is_order_independent(self) -> None:
+        """Test that hashed params are deterministic across dict orderings"""
+        digest1 = CacheKeyGenerator._hash_params({  # noqa: SLF001
+            "patient": "5",
+            "page": "1",
+            "user_id": 2,
+        })
+        digest2 = CacheKeyGenerator._hash_params({  # noqa: SLF001
+            "user_id": 2,
+            "patient": "5",
+            "page": "1",
+        })
+
+        assert digest1 == digest2
+        assert len(digest1) == 16
+        assert digest1 != CacheKeyGenerator._hash_params({  # noqa: SLF001
+            "patient": "5",
+            "page": "1",
+            "user_id": "2",
+        })
+
+    def test_single_scalar_param_is_embedded_without_hashing(self) -> None:
+        """Test that a single short scalar param produces a readable key"""
+        assert (
+            CacheKeyGenerator.generate_key("patients", "files", "list", patient="5")
+            == "patients:files:list:patient_5"
+        )
+        assert (
+            CacheKeyGenerator.generate_key("patients", "files", "list", user_id=7)
+            == "patients:files:list:user_id_7"
+        )
+        unsafe_key = CacheKeyGenerator.generate_key(
+            "patients", "files", "list", search="a b:c"
+        )
+        assert "a b:c" not in unsafe_key
+
+    def test_sha256_hash_can_be_selected(self) -> None:
+        """Test that DMR_CACHE_HASH=sha256 keeps 16-character digests"""
+        params = {"patient": "5", "page": "2"}
+        default_digest = CacheKeyGenerator._hash_params(params)  # noqa: SLF001
+
+        with patch.object(CacheKeyGenerator, "HASH_ALGORITHM", "sha256"):
+            sha_digest = CacheKeyGenerator._hash_params(params)  # noqa: SLF001
+
+        assert len(sha_digest) == 16
+        assert sha_digest != default_digest
+
     def test_different_params_generate_different_keys(self) -> None:
         """Test that different parameters generate different keys"""
         key1 = CacheKeyGenerator.generate_key(
@@ -58,6 +133,7 @@ class CacheKeyGeneratorTest(TestCase):
             user_id="1",
         )
 
+        assert "student_groups:observations:list" in patterns
         assert "student_groups:observations:list:*" in patterns
         assert "student_groups:observations:list:patient_id_5:*" in patterns
         assert "student_groups:observations:list:user_id_1:*" in patterns
@@ -111,9 +187,9 @@ class CacheManagerTest(TestCase):
 
     def test_invalidate_cache_pattern_clears_matching_keys(self) -> None:
         """Test cache invalidation by pattern"""
-        cache.set("prefix:key1", "value1", 300)
-        cache.set("prefix:key2", "value2", 300)
-        cache.set("other:key3", "value3", 300)
+        CacheManager.set_cached("prefix:key1", "value1", 300)
+        CacheManager.set_cached("prefix:key2", "value2", 300)
+        CacheManager.set_cached("other:key3", "value3", 300)
 
         assert cache.get("prefix:key1") is not None
         assert cache.get("other:key3") is not None
@@ -124,6 +200,176 @@ class CacheManagerTest(TestCase):
         assert cache.get("prefix:key2") is None
         assert cache.get("other:key3") is not None
 
+    def test_invalidate_cache_drains_key_index(self) -> None:
+        """Test that invalidated keys are removed from the secondary index"""
+        CacheManager.set_cached("indexed:model:key1", "value1", 300)
+        CacheManager.set_cached("indexed:other:key2", "value2", 300)
+
+        CacheManager.invalidate_cache(["indexed:model:*"])
+
+        index = CacheManager._key_index  # noqa: SLF001
+        assert "indexed:model" not in index
+        assert "indexed:other:key2" in index["indexed:other"]
+        assert cache.get("indexed:other:key2") == "value2"
+
+    def test_key_index_is_bounded_per_namespace(self) -> None:
+        """Test that a full namespace prunes expired keys, then invalidates"""
+        index = CacheManager._key_index  # noqa: SLF001
+
+        with patch.object(CacheManager, "KEY_INDEX_MAX_KEYS", 3):
+            for number in range(3):
+                CacheManager.set_cached(f"bounded:model:{number}", number, 300)
+            # An entry the backend dropped on its own is pruned, not counted
+            cache.delete("bounded:model:0")
+            CacheManager.set_cached("bounded:model:3", 3, 300)
+            assert index["bounded:model"] == {
+                "bounded:model:1",
+                "bounded:model:2",
+                "bounded:model:3",
+            }
+
+            # Still full after pruning: the namespace is invalidated
+            CacheManager.set_cached("bounded:model:4", 4, 300)
+
+        assert index["bounded:model"] == {"bounded:model:4"}
+        assert cache.get("bounded:model:1") is None
+        assert cache.get("bounded:model:4") == 4
+
+    def test_recompute_lock_is_stable_per_key(self) -> None:
+        """Test that concurrent misses on one key share the same lock"""
+        lock1 = CacheManager.recompute_lock("patients:patients:list:abc")
+        lock2 = CacheManager.recompute_lock("patients:patients:list:abc")
+
+        assert lock1 is lock2
+
+    def test_adaptive_ttl_scales_with_hits_per_write(self) -> None:
+        """Test that adaptive TTL grows for read-heavy namespaces and is clamped"""
+        redis = "django.core.cache.backends.redis.RedisCache"
+
+        with override_settings(
+            CACHES={"default": {"BACKEND": redis, "LOCATION": "redis://localhost"}}
+        ):
+            assert CacheManager.adaptive_ttl("adaptive:cold", 300) == 300
+
+            for _ in range(20):
+                CacheManager.record_hit("adaptive:hot")
+            CacheManager.record_write("adaptive:hot")
+            assert 300 < CacheManager.adaptive_ttl("adaptive:hot", 300) <= 3600
+
+            assert CacheManager.adaptive_ttl("adaptive:cold", 10) == 60
+            assert CacheManager.adaptive_ttl("adaptive:hot", 10_000) == 3600
+
+    def test_adaptive_ttl_capped_on_process_local_cache(self) -> None:
+        """Test that a per-process cache never stretches TTLs past the default"""
+        for _ in range(100):
+            CacheManager.record_hit("adaptive:local")
+        CacheManager.record_write("adaptive:local")
+
+        assert CacheManager.adaptive_ttl("adaptive:local", 300) == (
+            CacheKeyGenerator.DEFAULT_TTL
+        )
+
+    def test_adaptive_ttl_capped_without_cross_worker_invalidation(self) -> None:
+        """Test that shared backends invalidated via the local index keep the cap"""
+        import tempfile
+
+        for _ in range(100):
+            CacheManager.record_hit("adaptive:files")
+        CacheManager.record_write("adaptive:files")
+
+        with (
+            tempfile.TemporaryDirectory() as location,
+            override_settings(
+                CACHES={
+                    "default": {
+                        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                        "LOCATION": location,
+                    },
+                },
+            ),
+        ):
+            assert CacheManager.is_shared_backend()
+            assert CacheManager.adaptive_ttl("adaptive:files", 300) == (
+                CacheKeyGenerator.DEFAULT_TTL
+            )
+
+    def test_redis_invalidation_pipelines_all_patterns(self) -> None:
+        """Test that django-redis invalidation deletes every pattern in one pipeline"""
+        from unittest.mock import Mock
+
+        redis_client = Mock()
+        redis_client.scan_iter.side_effect = [[b":1:a:m:list:1"], [b":1:a:m:list:2"]]
+        fake_cache = Mock()
+        fake_cache.client.make_pattern.side_effect = lambda pattern: f":1:{pattern}"
+        fake_cache.client.get_client.return_value = redis_client
+
+        with patch("core.cache.cache", fake_cache):
+            CacheManager._invalidate_redis_cache(["a:m:list", "a:m:list:*"])  # noqa: SLF001
+
+        pipeline = redis_client.pipeline.return_value
+        pipeline.unlink.assert_called_once_with(b":1:a:m:list:1", b":1:a:m:list:2")
+        pipeline.delete.assert_not_called()
+        pipeline.execute.assert_called_once()
+        fake_cache.delete_pattern.assert_not_called()
+
+    def test_only_cross_process_backends_are_shared(self) -> None:
+        """Test that process-local backends are not treated as shared"""
+        redis = "django.core.cache.backends.redis.RedisCache"
+
+        with override_settings(
+            CACHES={"default": {"BACKEND": redis, "LOCATION": "redis://localhost"}}
+        ):
+            assert CacheManager.is_shared_backend()
+        assert not CacheManager.is_shared_backend()
+
+    def test_native_redis_backend_scans_redis(self) -> None:
+        """Test that Django's RedisCache is invalidated in Redis, not via the key index"""
+        from unittest.mock import Mock
+
+        with override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                    "LOCATION": "redis://localhost:6379",
+                },
+            },
+        ):
+            invalidator = CacheManager._get_invalidator()  # noqa: SLF001
+        assert invalidator is CacheManager._invalidate_native_redis_cache  # noqa: SLF001
+        assert CacheManager._get_invalidator() is CacheManager._invalidate_locmem_cache  # noqa: SLF001
+
+        redis_client = Mock()
+        redis_client.scan_iter.return_value = [b":1:a:m:list"]
+        fake_cache = Mock()
+        fake_cache.make_key.side_effect = lambda pattern: f":1:{pattern}"
+        fake_cache._cache.get_client.return_value = redis_client  # noqa: SLF001
+
+        with patch("core.cache.cache", fake_cache):
+            CacheManager._invalidate_native_redis_cache(["a:m:list"])  # noqa: SLF001
+
+        redis_client.scan_iter.assert_called_once_with(
+            match=":1:a:m:list", count=10_000
+        )
+        redis_client.pipeline.return_value.unlink.assert_called_once_with(
+            b":1:a:m:list"
+        )
+
+    def test_l1_layer_serves_repeat_reads_until_invalidated(self) -> None:
+        """Test that the optional in-process layer skips the backend for repeat reads"""
+        CacheManager.set_cached("l1:model:list", "value", 300)
+
+        with (
+            patch.object(CacheManager, "L1_TTL", 5),
+            patch("core.cache.cache.get", wraps=cache.get) as backend_get,
+        ):
+            assert CacheManager.get_cached("l1:model:list") == "value"
+            assert CacheManager.get_cached("l1:model:list") == "value"
+            assert backend_get.call_count == 1
+
+            CacheManager.invalidate_cache("l1:model:list")
+            assert CacheManager.get_cached("l1:model:list") is None
+            assert backend_get.call_count == 2
+
     def test_set_cached_with_ttl(self) -> None:
         """Test that set_cached respects TTL"""
         test_data = {"test": "data"}
@@ -136,9 +382,9 @@ class CacheManagerTest(TestCase):
 
     def test_invalidate_multiple_patterns(self) -> None:
         """Test invalidating multiple cache patterns"""
-        cache.set("app1:model1:key", "value1", 300)
-        cache.set("app2:model2:key", "value2", 300)
-        cache.set("app1:model2:key", "value3", 300)
+        CacheManager.set_cached("app1:model1:key", "value1", 300)
+        CacheManager.set_cached("app2:model2:key", "value2", 300)
+        CacheManager.set_cached("app1:model2:key", "value3", 300)
 
         CacheManager.invalidate_cache(["app1:model1:*", "app2:model2:*"])
 
@@ -228,6 +474,91 @@ class ObservationViewSetCachingTest(APITestCase):
         assert hasattr(viewset, "cache_app")
         assert viewset.cache_app == "student_groups"
 
+    def test_list_cache_key_memoized_per_request(self) -> None:
+        """Test that the list cache key is only generated once per request"""
+        from student_groups.views import NoteViewSet
+
+        user = User.objects.create_user(username="memo", password="pass")
+        request = Request(APIRequestFactory().get("/notes/", {"patient": "1"}))
+        request.user = user
+        viewset = NoteViewSet()
+
+        with patch.object(
+            CacheKeyGenerator,
+            "generate_key_with_prefix",
+            wraps=CacheKeyGenerator.generate_key_with_prefix,
+        ) as generate_key:
+            key1 = viewset._get_list_cache_key(request)  # noqa: SLF001
+            key2 = viewset._get_list_cache_key(request)  # noqa: SLF001
+
+        assert key1 == key2
+        assert generate_key.call_count == 1
+        assert key1 == CacheKeyGenerator.generate_key(
+            "student_groups", "notes", "list", patient="1", user_id=user.id
+        )
+
+    def test_first_page_without_filters_uses_unhashed_key(self) -> None:
+        """Test that page=1 and no page share the short unparameterized key"""
+        from patients.views import PatientViewSet
+
+        factory = APIRequestFactory()
+        viewset = PatientViewSet()
+
+        no_page = Request(factory.get("/patients/"))
+        first_page = Request(factory.get("/patients/", {"page": "1"}))
+        second_page = Request(factory.get("/patients/", {"page": "2"}))
+
+        assert viewset._get_list_cache_key(no_page) == "patients:patients:list"  # noqa: SLF001
+        assert viewset._get_list_cache_key(first_page) == "patients:patients:list"  # noqa: SLF001
+        assert viewset._get_list_cache_key(second_page) != "patients:patients:list"  # noqa: SLF001
+
+    def test_empty_list_results_are_not_cacheable(self) -> None:
+        """Test that empty list pages are skipped by the cache write"""
+        from core.cache import CacheMixin
+
+        assert not CacheMixin._has_results({"count": 0, "results": []})  # noqa: SLF001
+        assert not CacheMixin._has_results([])  # noqa: SLF001
+        assert CacheMixin._has_results({"count": 1, "results": [{"id": 1}]})  # noqa: SLF001
+        assert CacheMixin._has_results([{"id": 1}])  # noqa: SLF001
+
+    def test_mixin_invalidation_keys_match_generator(self) -> None:
+        """Test that precomputed mixin patterns match generate_invalidation_keys"""
+        from unittest.mock import Mock
+
+        from student_groups.views import NoteViewSet
+
+        instance = Mock(patient_id=5)
+
+        assert NoteViewSet()._get_invalidation_keys(instance) == (  # noqa: SLF001
+            CacheKeyGenerator.generate_invalidation_keys(
+                "student_groups", "notes", patient_id=5
+            )
+        )
+        assert NoteViewSet()._get_invalidation_keys(Mock(patient_id=None)) == []  # noqa: SLF001
+
+    def test_mixin_batches_invalidation_per_request(self) -> None:
+        """Test that writes in one request are invalidated together on finalize"""
+        from unittest.mock import Mock
+
+        from student_groups.views import NoteViewSet
+
+        view = NoteViewSet()
+        with patch.object(CacheManager, "invalidate_cache") as invalidate:
+            view._invalidate_cache_for_instance(Mock(patient_id=5))  # noqa: SLF001
+            view._invalidate_cache_for_instance(Mock(patient_id=5))  # noqa: SLF001
+            view._invalidate_cache_for_instance(Mock(patient_id=6))  # noqa: SLF001
+            invalidate.assert_not_called()
+
+            view._flush_cache_invalidation()  # noqa: SLF001
+            view._flush_cache_invalidation()  # noqa: SLF001
+
+        invalidate.assert_called_once_with([
+            "student_groups:notes:list",
+            "student_groups:notes:list:*",
+            "student_groups:notes:list:patient_id_5:*",
+            "student_groups:notes:list:patient_id_6:*",
+        ])
+
     def test_observation_cache_retrieve_params(self) -> None:
         """Test observation cache retrieve parameters"""
         from student_groups.views import BaseObservationViewSet
@@ -307,6 +638,21 @@ class InvestigationRequestCachingTest(APITestCase):
 class PatientAndFileCachingTest(APITestCase):
     """Test patient and file endpoints caching"""
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create one instructor and one patient for the list endpoint tests"""
+        from django.contrib.auth.models import Group
+
+        from core.context import Role
+        from tests.test_utils import RoleFixtureMixin
+
+        cls.instructor = User.objects.create_user(username="lists", password="pass")
+        cls.instructor.groups.add(
+            Group.objects.get_or_create(name=Role.INSTRUCTOR.value)[0]
+        )
+        # Empty pages are not cached, so each list has one result to store
+        RoleFixtureMixin.create_patient()
+
     def setUp(self) -> None:
         """Set up test client and clear cache"""
         cache.clear()
@@ -320,6 +666,143 @@ class PatientAndFileCachingTest(APITestCase):
         assert viewset.cache_app == "patients"
         assert viewset.cache_model == "patients"
 
+    def test_cached_patient_list_honours_if_none_match(self) -> None:
+        """Test that a cached list returns 304 for a matching ETag"""
+        from django.urls import reverse
+
+        self.client.force_authenticate(self.instructor)
+        url = reverse("patient-list")
+
+        first = self.client.get(url)
+        etag = first["ETag"]
+        cached = self.client.get(url)
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        stale = self.client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+
+        assert first.status_code == 200
+        assert cached["ETag"] == etag
+        assert cached.json() == first.json()
+        assert not_modified.status_code == 304
+        assert not not_modified.content
+        assert stale.status_code == 200
+
+    def test_cache_miss_renders_list_once(self) -> None:
+        """Test that a cache miss reuses the cached bytes for its own response"""
+        from django.urls import reverse
+        from rest_framework.renderers import JSONRenderer
+
+        self.client.force_authenticate(self.instructor)
+
+        with patch.object(
+            JSONRenderer, "render", autospec=True, side_effect=JSONRenderer.render
+        ) as render:
+            response = self.client.get(reverse("patient-list"))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response.json()["count"] == 1
+        assert render.call_count == 1
+
+    def test_recompute_lock_wait_is_bounded(self) -> None:
+        """Test that a miss stops waiting on a held recompute lock and rebuilds"""
+        from django.urls import reverse
+
+        self.client.force_authenticate(self.instructor)
+        locks = CacheManager._recompute_locks  # noqa: SLF001
+
+        with patch.object(CacheManager, "RECOMPUTE_LOCK_TIMEOUT", 0.01):
+            for lock in locks:
+                lock.acquire()
+            try:
+                response = self.client.get(reverse("patient-list"))
+            finally:
+                for lock in locks:
+                    lock.release()
+
+        assert response.status_code == 200
+
+    def test_zero_ttl_disables_list_caching(self) -> None:
+        """Test that cache_ttl = 0 bypasses the cache without building a key"""
+        from django.urls import reverse
+
+        from patients.views import PatientViewSet
+
+        self.client.force_authenticate(self.instructor)
+
+        with (
+            patch.object(PatientViewSet, "cache_ttl", 0),
+            patch.object(CacheParamBuilder, "build_from_request") as build,
+            patch.object(CacheManager, "set_cached") as set_cached,
+        ):
+            response = self.client.get(reverse("patient-list"))
+
+        assert response.status_code == 200
+        build.assert_not_called()
+        set_cached.assert_not_called()
+
+    def test_large_list_page_is_cached_compressed(self) -> None:
+        """Test that pages over the compression threshold round-trip through zlib"""
+        from django.urls import reverse
+
+        from patients.views import PatientViewSet
+
+        self.client.force_authenticate(self.instructor)
+
+        with (
+            patch.object(PatientViewSet, "cache_compress_min_bytes", 1),
+            patch.object(
+                CacheManager, "set_cached", wraps=CacheManager.set_cached
+            ) as set_cached,
+        ):
+            first = self.client.get(reverse("patient-list"))
+            second = self.client.get(reverse("patient-list"))
+
+        (_, (_, stored, compressed), _), _ = set_cached.call_args
+        assert compressed is True
+        assert stored != first.content
+        assert second.content == first.content
+        assert second.json()["count"] == 1
+
+    def test_list_entry_in_old_format_is_a_miss(self) -> None:
+        """Test that a cached list entry of another shape is rebuilt, not a 500"""
+        from django.urls import reverse
+
+        self.client.force_authenticate(self.instructor)
+        url = reverse("patient-list")
+        self.client.get(url)
+        (key,) = [
+            key
+            for keys in CacheManager._key_index.values()  # noqa: SLF001
+            for key in keys
+            if key.startswith("patients:patients:list")
+        ]
+        cache.set(key, ('"old"', b"[]"), 300)
+
+        response = self.client.get(url)
+
+        assert response.status_code == 200
+        assert response["ETag"] != '"old"'
+        assert len(cache.get(key)) == 3
+
+    def test_oversized_list_page_is_not_cached(self) -> None:
+        """Test that list pages above the byte budget are served uncached"""
+        from django.urls import reverse
+
+        from patients.views import PatientViewSet
+
+        self.client.force_authenticate(self.instructor)
+
+        with (
+            patch.object(PatientViewSet, "cache_max_bytes", 10),
+            patch.object(CacheManager, "set_cached") as set_cached,
+        ):
+            response = self.client.get(reverse("patient-list"))
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+        assert "ETag" not in response
+        set_cached.assert_not_called()
+
     def test_file_viewset_has_caching(self) -> None:
         """Test that FileViewSet has caching configured"""
         from patients.views import FileViewSet
@@ -340,9 +823,13 @@ class CacheInvalidationStrategyTest(TestCase):
 
     def test_observation_invalidation_pattern(self) -> None:
         """Test observation cache invalidation pattern"""
-        cache.set("student_groups:observations:list:hash1", {"data": "test"}, 300)
-        cache.set("student_groups:observations:list:hash2", {"data": "test"}, 300)
-        cache.set("other:app:data", {"data": "keep"}, 300)
+        CacheManager.set_cached(
+            "student_groups:observations:list:hash1", {"data": "test"}, 300
+        )
+        CacheManager.set_cached(
+            "student_groups:observations:list:hash2", {"data": "test"}, 300
+        )
+        CacheManager.set_cached("other:app:data", {"data": "keep"}, 300)
 
         assert cache.get("student_groups:observations:list:hash1") is not None
         assert cache.get("other:app:data") is not None
@@ -356,7 +843,7 @@ class CacheInvalidationStrategyTest(TestCase):
 
     def test_investigation_request_invalidation_pattern(self) -> None:
         """Test investigation request cache invalidation"""
-        cache.set(
+        CacheManager.set_cached(
             "student_groups:investigation_requests:list:hash1",
             {"data": "test"},
             300,
@@ -368,7 +855,7 @@ class CacheInvalidationStrategyTest(TestCase):
 
         assert cache.get("student_groups:investigation_requests:list:hash1") is None
 
-        cache.set(
+        CacheManager.set_cached(
             "student_groups:investigation_requests:list:hash1",
             {"data": "test"},
             300,
@@ -382,18 +869,40 @@ class CacheInvalidationStrategyTest(TestCase):
 
     def test_file_invalidation_pattern(self) -> None:
         """Test file cache invalidation"""
-        cache.set("patients:files:list:hash1", {"data": "test"}, 300)
+        CacheManager.set_cached("patients:files:list:hash1", {"data": "test"}, 300)
+
+        CacheManager.invalidate_cache(["patients:files:write:patient_id:*"])
+
+        assert cache.get("patients:files:list:hash1") is None
+
+    def test_generated_patterns_clear_unparameterized_list_key(self) -> None:
+        """Test that write invalidation also clears the plain first-page key"""
+        CacheManager.set_cached("patients:patients:list", {"data": "test"}, 300)
+
+        CacheManager.invalidate_cache(
+            CacheKeyGenerator.generate_invalidation_keys("patients", "patients", id=1)
+        )
+
+        assert cache.get("patients:patients:list") is None
+
+    def test_invalidation_matches_key_prefix_only(self) -> None:
+        """Test that patterns only clear keys that start with the prefix"""
+        CacheManager.set_cached("patients:files:list:hash1", "value1", 300)
+        CacheManager.set_cached("other:patients:files:list:hash1", "value2", 300)
+        CacheManager.set_cached("patients:files_archive:list:hash1", "value3", 300)
 
         CacheManager.invalidate_cache(["patients:files:write:patient_id:*"])
 
         assert cache.get("patients:files:list:hash1") is None
+        assert cache.get("other:patients:files:list:hash1") == "value2"
+        assert cache.get("patients:files_archive:list:hash1") == "value3"
 
     def test_multi_pattern_invalidation(self) -> None:
         """Test invalidating multiple patterns simultaneously"""
-        cache.set("app1:model1:data1", "value1", 300)
-        cache.set("app1:model2:data2", "value2", 300)
-        cache.set("app2:model1:data3", "value3", 300)
-        cache.set("other:data4", "value4", 300)
+        CacheManager.set_cached("app1:model1:data1", "value1", 300)
+        CacheManager.set_cached("app1:model2:data2", "value2", 300)
+        CacheManager.set_cached("app2:model1:data3", "value3", 300)
+        CacheManager.set_cached("other:data4", "value4", 300)
 
         CacheManager.invalidate_cache([
             "app1:model1:*",
@@ -458,16 +967,20 @@ class CacheKeyStrategyTest(TestCase):
 class UserIsolationTest(APITestCase):
     """Test that cache prevents data leakage between different users"""
 
-    def setUp(self) -> None:
-        """Set up test users and clear cache"""
-        cache.clear()
-        self.user1 = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up test users once per class"""
+        cls.user1 = User.objects.create_user(
             username="student1", email="student1@test.com", password="pass"
         )
-        self.user2 = User.objects.create_user(
+        cls.user2 = User.objects.create_user(
             username="student2", email="student2@test.com", password="pass"
         )
 
+    def setUp(self) -> None:
+        """Clear cache before each test"""
+        cache.clear()
+
     def test_cache_key_includes_user_id_when_user_sensitive(self) -> None:
         """Test that user-sensitive cache keys include user ID"""
         key1 = CacheKeyGenerator.generate_key(
@@ -221,19 +221,19 @@ class PatientFilteringTestCase(TestCase):
             f"/api/student-groups/observations/blood-pressures/?patient={self.patient1.id}",
         )
         assert bp_response.status_code == status.HTTP_200_OK
-        assert bp_response.data["count"] == 1
+        assert bp_response.json()["count"] == 1
 
         # Heart rate for patient1
         hr_response = self.client.get(
             f"/api/student-groups/observations/heart-rates/?patient={self.patient1.id}",
         )
         assert hr_response.status_code == status.HTTP_200_OK
-        assert hr_response.data["count"] == 1
+        assert hr_response.json()["count"] == 1
 
         # Both should be for the same patient
         assert (
-            bp_response.data["results"][0]["patient"]
-            == hr_response.data["results"][0]["patient"]
+            bp_response.json()["results"][0]["patient"]
+            == hr_response.json()["results"][0]["patient"]
         )
 
     def test_backward_compatibility_notes_endpoint(self) -> None:
@@ -1,13 +1,19 @@
 """
 Test utilities for the DMR project.
 
-This module provides common utility functions used across test files.
+This module provides common utility functions and fixtures used across test files.
 """
 
 from io import BytesIO
+from uuid import uuid4
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from PyPDF2 import PdfWriter
 
+from core.context import Role
+from patients.models import Patient
+
 
 def create_test_pdf(num_pages=1, width=612, height=792):
     """
@@ -39,3 +45,53 @@ def create_test_pdf(num_pages=1, width=612, height=792):
     buffer.seek(0)
 
     return buffer.read()
+
+
+class RoleFixtureMixin:
+    """Reusable helpers for creating role-aware users and patients."""
+
+    # Intentionally using a fixed test password for fixtures. Marked to ignore S105.
+    DEFAULT_PASSWORD = "test123"  # noqa: S105
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.role_groups = {
+            Role.ADMIN.value: Group.objects.get_or_create(name=Role.ADMIN.value)[0],
+            Role.INSTRUCTOR.value: Group.objects.get_or_create(
+                name=Role.INSTRUCTOR.value,
+            )[0],
+            Role.STUDENT.value: Group.objects.get_or_create(name=Role.STUDENT.value)[0],
+        }
+
+    @classmethod
+    def create_user(cls, username, role=None, **extra):
+        """Create a user and attach them to the requested role group."""
+
+        user = get_user_model().objects.create_user(
+            username=username,
+            password=extra.pop("password", cls.DEFAULT_PASSWORD),
+            **extra,
+        )
+        if role:
+            role_value = role.value if isinstance(role, Role) else role
+            user.groups.add(cls.role_groups[role_value])
+        return user
+
+    @classmethod
+    def create_patient(cls, **overrides):
+        """Create a patient with the new mandatory identifiers populated."""
+
+        suffix = uuid4().hex[:8]
+        defaults = {
+            "first_name": "Test",
+            "last_name": "Patient",
+            "date_of_birth": "1990-01-01",
+            "gender": Patient.Gender.UNSPECIFIED,
+            "mrn": f"MRN_CORE_{suffix}",
+            "ward": "Ward Core",
+            "bed": "Bed 1",
+            "phone_number": f"+7000{suffix[:6]}",
+        }
+        defaults.update(overrides)
+        return Patient.objects.create(**defaults)